@@ -5,7 +5,7 @@ This module provides production-ready resilience patterns:
 - RetryPolicy: Exponential backoff with jitter
 - RateLimiter: Token bucket algorithm with adaptive mode
 - CircuitBreaker: Closed/Open/Half-Open state machine
-- Backpressure: Semaphore-based concurrency control
+- Backpressure: Permit-based concurrency control
 - FallbackChain: Multi-model degradation
 - ResilientExecutor: Unified executor combining all patterns
 - SignalsSnapshot: Unified runtime state aggregation
@@ -29,8 +29,10 @@ from ai_lib_python.resilience.fallback import (
     FallbackChain,
     FallbackConfig,
     FallbackResult,
+    FallbackStrategy,
     FallbackTarget,
     MultiFallback,
+    TargetTimeoutError,
 )
 from ai_lib_python.resilience.preflight import (
     PreflightChecker,
@@ -77,6 +79,7 @@ __all__ = [
     "FallbackChain",
     "FallbackConfig",
     "FallbackResult",
+    "FallbackStrategy",
     "FallbackTarget",
     # Signals
     "InflightSnapshot",
@@ -98,5 +101,6 @@ __all__ = [
     "RetryPolicy",
     "RetryResult",
     "SignalsSnapshot",
+    "TargetTimeoutError",
     "with_retry",
 ]
@@ -1,5 +1,5 @@
 """
-Backpressure control using semaphores.
+Backpressure control using a permit counter.
 
 Limits concurrent operations to prevent overload.
 """
@@ -7,18 +7,22 @@ Limits concurrent operations to prevent overload.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import os
+from collections import deque
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, TypeVar
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Awaitable, Callable
+    from contextlib import AbstractAsyncContextManager
+    from types import TracebackType
 
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(slots=True)
 class BackpressureConfig:
     """Configuration for backpressure control.
 
@@ -55,11 +59,43 @@ class BackpressureError(Exception):
         super().__init__(message)
 
 
+def _expire_waiter(waiter: asyncio.Future[None]) -> None:
+    """Fail a permit waiter whose queue timeout has elapsed."""
+    if not waiter.done():
+        waiter.set_exception(asyncio.TimeoutError())
+
+
+class _UnlimitedPermit:
+    """Reusable context manager for unlimited backpressure.
+
+    Only updates the owner's statistics, avoiding the generator frame
+    that ``@asynccontextmanager`` creates on every acquire.
+    """
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner: Backpressure) -> None:
+        self._owner = owner
+
+    async def __aenter__(self) -> None:
+        self._owner._take_permits()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self._owner._current_inflight -= 1
+
+
 class Backpressure:
-    """Backpressure control using semaphores.
+    """Backpressure control using a permit counter.
 
     Limits the number of concurrent operations to prevent
-    overwhelming downstream services.
+    overwhelming downstream services. Permits are tracked with a plain
+    counter and handed to waiters in FIFO order, so checking and taking
+    a permit never yields to the event loop.
 
     Example:
         >>> bp = Backpressure(BackpressureConfig(max_concurrent=5))
@@ -70,6 +106,17 @@ class Backpressure:
         >>> result = await bp.execute(async_operation)
     """
 
+    __slots__ = (
+        "_config",
+        "_current_inflight",
+        "_max_concurrent",
+        "_peak_inflight",
+        "_total_acquired",
+        "_total_rejected",
+        "_unlimited_permit",
+        "_waiters",
+    )
+
     def __init__(self, config: BackpressureConfig | None = None) -> None:
         """Initialize backpressure control.
 
@@ -77,14 +124,13 @@ class Backpressure:
             config: Backpressure configuration
         """
         self._config = config or BackpressureConfig()
+        self._max_concurrent = self._config.max_concurrent
 
-        # Create semaphore if limiting is enabled
-        if self._config.max_concurrent > 0:
-            self._semaphore: asyncio.Semaphore | None = asyncio.Semaphore(
-                self._config.max_concurrent
-            )
-        else:
-            self._semaphore = None
+        # (permit count, future) for tasks waiting on permits, in FIFO order
+        self._waiters: deque[tuple[int, asyncio.Future[None]]] = deque()
+
+        # Unlimited mode reuses one context manager for every acquire
+        self._unlimited_permit = _UnlimitedPermit(self) if self._max_concurrent <= 0 else None
 
         # Statistics
         self._current_inflight = 0
@@ -100,89 +146,191 @@ class Backpressure:
     @property
     def available_permits(self) -> int:
         """Get number of available permits."""
-        if self._semaphore is None:
+        if self._max_concurrent <= 0:
             return float("inf")  # type: ignore
-        return self._config.max_concurrent - self._current_inflight
+        return self._max_concurrent - self._current_inflight
 
     @property
     def is_limited(self) -> bool:
         """Check if backpressure limiting is enabled."""
-        return self._semaphore is not None
+        return self._max_concurrent > 0
 
-    @asynccontextmanager
-    async def acquire(self) -> AsyncIterator[None]:
+    def snapshot(self) -> tuple[int, int]:
+        """Get a consistent view of the concurrency limit and usage.
+
+        Returns:
+            Tuple of (max_concurrent, in_use)
+        """
+        return self._max_concurrent, self._current_inflight
+
+    def _take_permits(self, count: int = 1) -> None:
+        """Account for newly granted permits.
+
+        Args:
+            count: Number of permits granted
+        """
+        inflight = self._current_inflight + count
+        self._current_inflight = inflight
+        if inflight > self._peak_inflight:
+            self._peak_inflight = inflight
+        self._total_acquired += count
+
+    def _try_take(self, count: int = 1) -> bool:
+        """Take permits if enough are free, without waiting.
+
+        Queued waiters are served first so that a newcomer cannot
+        overtake tasks that are already waiting.
+
+        Args:
+            count: Number of permits to take
+
+        Returns:
+            True if the permits were taken
+        """
+        if self._max_concurrent <= 0:
+            self._take_permits(count)
+            return True
+        if self._waiters or self._current_inflight + count > self._max_concurrent:
+            return False
+        self._take_permits(count)
+        return True
+
+    def _wake_waiters(self) -> None:
+        """Hand free permits to queued waiters in FIFO order."""
+        waiters = self._waiters
+        while waiters:
+            count, waiter = waiters[0]
+            if waiter.done():
+                waiters.popleft()
+                continue
+            if self._current_inflight + count > self._max_concurrent:
+                break
+            waiters.popleft()
+            self._take_permits(count)
+            waiter.set_result(None)
+
+    async def _wait_for_permits(self, count: int = 1) -> None:
+        """Wait until the requested permits are handed to this task.
+
+        Args:
+            count: Number of permits to wait for
+
+        Raises:
+            BackpressureError: If the queue timeout is exceeded
+        """
+        loop = asyncio.get_running_loop()
+        waiter: asyncio.Future[None] = loop.create_future()
+        entry = (count, waiter)
+        self._waiters.append(entry)
+
+        # Arm the timeout directly on the waiter instead of going through
+        # wait_for, which allocates its own future and callbacks per call.
+        timeout = self._config.queue_timeout
+        handle = loop.call_later(timeout, _expire_waiter, waiter) if timeout is not None else None
+        try:
+            await waiter
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled() and waiter.exception() is None:
+                # The permits were handed over just as we were cancelled
+                self.release_many(count)
+            else:
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(entry)
+                # A smaller waiter behind us may fit now
+                self._wake_waiters()
+            if isinstance(e, asyncio.TimeoutError):
+                self._total_rejected += 1
+                raise BackpressureError("Timeout waiting for permit") from None
+            raise
+        finally:
+            if handle is not None:
+                handle.cancel()
+
+    def acquire(self) -> AbstractAsyncContextManager[None]:
         """Acquire a permit for an operation.
 
-        Yields:
-            None when permit acquired
+        Returns:
+            Async context manager holding the permit
 
         Raises:
-            BackpressureError: If timeout exceeded
-            asyncio.TimeoutError: If timeout exceeded
+            BackpressureError: If timeout exceeded (on enter)
         """
-        if self._semaphore is None:
-            # No limiting
-            self._current_inflight += 1
-            self._peak_inflight = max(self._peak_inflight, self._current_inflight)
-            self._total_acquired += 1
-            try:
-                yield
-            finally:
-                self._current_inflight -= 1
-            return
+        if self._unlimited_permit is not None:
+            return self._unlimited_permit
+        return self._acquire_limited()
+
+    @asynccontextmanager
+    async def _acquire_limited(self) -> AsyncIterator[None]:
+        """Hold a permit when limiting is enabled."""
+        if not self._try_take():
+            await self._wait_for_permits()
 
         try:
-            if self._config.queue_timeout is not None:
-                # Wait with timeout
-                await asyncio.wait_for(
-                    self._semaphore.acquire(),
-                    timeout=self._config.queue_timeout,
-                )
-            else:
-                # Wait indefinitely
-                await self._semaphore.acquire()
+            yield
+        finally:
+            self.release()
 
-            self._current_inflight += 1
-            self._peak_inflight = max(self._peak_inflight, self._current_inflight)
-            self._total_acquired += 1
+    async def acquire_many(self, count: int) -> None:
+        """Acquire several permits at once.
 
-            try:
-                yield
-            finally:
-                self._current_inflight -= 1
-                self._semaphore.release()
+        The permits are granted together, so launching a batch of
+        ``count`` operations costs a single wait instead of one per
+        operation. Release them with :meth:`release_many`.
 
-        except asyncio.TimeoutError:
-            self._total_rejected += 1
-            raise BackpressureError("Timeout waiting for permit") from None
+        Args:
+            count: Number of permits to acquire
+
+        Raises:
+            ValueError: If count is not positive or exceeds max_concurrent
+            BackpressureError: If timeout exceeded
+        """
+        if count <= 0:
+            raise ValueError("count must be positive")
+        if 0 < self._max_concurrent < count:
+            raise ValueError(
+                f"Cannot acquire {count} permits with max_concurrent={self._max_concurrent}"
+            )
+        if not self._try_take(count):
+            await self._wait_for_permits(count)
 
     async def try_acquire(self) -> bool:
         """Try to acquire a permit without waiting.
 
+        The check and the acquisition happen without an intervening
+        ``await``, so a free permit cannot be taken by another task
+        between them.
+
         Returns:
             True if permit acquired, False otherwise
         """
-        if self._semaphore is None:
-            self._current_inflight += 1
-            self._peak_inflight = max(self._peak_inflight, self._current_inflight)
-            self._total_acquired += 1
-            return True
+        return self._try_take()
+
+    def try_acquire_nowait(self) -> bool:
+        """Try to acquire a permit without waiting, from synchronous code.
 
-        # Try to acquire without waiting
-        acquired = self._semaphore.locked() is False
-        if acquired:
-            await self._semaphore.acquire()
-            self._current_inflight += 1
-            self._peak_inflight = max(self._peak_inflight, self._current_inflight)
-            self._total_acquired += 1
+        Queued waiters are served first. Release the permit with
+        :meth:`release`.
 
-        return acquired
+        Returns:
+            True if permit acquired, False otherwise
+        """
+        return self._try_take()
 
     def release(self) -> None:
         """Release a permit (if using try_acquire)."""
         self._current_inflight -= 1
-        if self._semaphore is not None:
-            self._semaphore.release()
+        if self._waiters:
+            self._wake_waiters()
+
+    def release_many(self, count: int) -> None:
+        """Release permits acquired with :meth:`acquire_many`.
+
+        Args:
+            count: Number of permits to release
+        """
+        self._current_inflight -= count
+        if self._waiters:
+            self._wake_waiters()
 
     async def execute(
         self,
@@ -217,6 +365,6 @@ class Backpressure:
         }
 
     def __repr__(self) -> str:
-        if self._semaphore is None:
+        if self._max_concurrent <= 0:
             return "Backpressure(unlimited)"
         return f"Backpressure(inflight={self._current_inflight}/{self._config.max_concurrent})"
@@ -10,16 +10,22 @@ Implements the circuit breaker pattern with three states:
 from __future__ import annotations
 
 import asyncio
+import sys
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Hashable
 
 T = TypeVar("T")
 
+# Happy-path successes recorded by execute_fast() are folded into the
+# statistics in batches of this size (or whenever get_stats() is called).
+_FAST_PATH_FLUSH_INTERVAL = 128
+
 
 class CircuitState(str, Enum):
     """Circuit breaker states."""
@@ -29,7 +35,7 @@ class CircuitState(str, Enum):
     HALF_OPEN = "half_open"
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreakerConfig:
     """Configuration for circuit breaker.
 
@@ -38,6 +44,9 @@ class CircuitBreakerConfig:
         success_threshold: Number of successes in half-open to close
         cooldown_seconds: Time to wait before testing (half-open)
         timeout_seconds: Optional timeout for operations
+        cache_enabled: Cache successful results of calls made with a cache_key
+        cache_ttl_s: How long a cached result stays valid, in seconds
+        cache_max_entries: Maximum cached results (least recently used are evicted)
     """
 
     failure_threshold: int = 5
@@ -45,6 +54,9 @@ class CircuitBreakerConfig:
     cooldown_seconds: float = 30.0
     timeout_seconds: float | None = None
     half_open_max_concurrent: int = 1
+    cache_enabled: bool = False
+    cache_ttl_s: float = 0.0
+    cache_max_entries: int = 1024
 
     @classmethod
     def default(cls) -> CircuitBreakerConfig:
@@ -77,7 +89,7 @@ class CircuitOpenError(Exception):
         self.time_until_retry = time_until_retry
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitStats:
     """Statistics for circuit breaker."""
 
@@ -88,6 +100,8 @@ class CircuitStats:
     state_changes: int = 0
     last_failure_time: float | None = None
     last_success_time: float | None = None
+    cache_hits: int = 0
+    cache_misses: int = 0
 
 
 class CircuitBreaker:
@@ -95,6 +109,10 @@ class CircuitBreaker:
 
     Prevents cascading failures by failing fast when a service is unhealthy.
 
+    State changes are synchronous and never span an ``await``, so the
+    breaker is safe to share between tasks on one event loop without a
+    lock. It is not thread-safe.
+
     Example:
         >>> breaker = CircuitBreaker(CircuitBreakerConfig(failure_threshold=3))
         >>> try:
@@ -103,6 +121,26 @@ class CircuitBreaker:
         ...     print("Service unavailable")
     """
 
+    __slots__ = (
+        "_cache",
+        "_cache_hits",
+        "_cache_misses",
+        "_config",
+        "_failed_requests",
+        "_failure_count",
+        "_half_open_semaphore",
+        "_happy_count",
+        "_last_failure_time",
+        "_last_success_time",
+        "_opened_at",
+        "_rejected_requests",
+        "_state",
+        "_state_changes",
+        "_success_count",
+        "_successful_requests",
+        "_total_requests",
+    )
+
     def __init__(self, config: CircuitBreakerConfig | None = None) -> None:
         """Initialize circuit breaker.
 
@@ -111,7 +149,6 @@ class CircuitBreaker:
         """
         self._config = config or CircuitBreakerConfig()
         self._state = CircuitState.CLOSED
-        self._lock = asyncio.Lock()
 
         # Failure tracking
         self._failure_count = 0
@@ -122,8 +159,19 @@ class CircuitBreaker:
         # Half-open state management
         self._half_open_semaphore = asyncio.Semaphore(self._config.half_open_max_concurrent)
 
-        # Statistics
-        self._stats = CircuitStats()
+        # Result cache for idempotent calls: key -> (expires_at, value)
+        self._cache: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+        # Statistics, kept as plain counters and materialized by get_stats()
+        self._total_requests = 0
+        self._successful_requests = 0
+        self._failed_requests = 0
+        self._rejected_requests = 0
+        self._state_changes = 0
+        self._last_success_time: float | None = None
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._happy_count = 0
 
     @property
     def state(self) -> CircuitState:
@@ -133,23 +181,43 @@ class CircuitBreaker:
     @property
     def is_closed(self) -> bool:
         """Check if circuit is closed (normal operation)."""
-        return self._state == CircuitState.CLOSED
+        return self._state is CircuitState.CLOSED
 
     @property
     def is_open(self) -> bool:
         """Check if circuit is open (failing fast)."""
-        return self._state == CircuitState.OPEN
+        return self._state is CircuitState.OPEN
 
     @property
     def is_half_open(self) -> bool:
         """Check if circuit is half-open (testing)."""
-        return self._state == CircuitState.HALF_OPEN
+        return self._state is CircuitState.HALF_OPEN
+
+    @property
+    def failure_count(self) -> int:
+        """Get the current consecutive failure count."""
+        return self._failure_count
+
+    @property
+    def failure_threshold(self) -> int:
+        """Get the failure count that trips the circuit."""
+        return self._config.failure_threshold
+
+    @property
+    def success_count(self) -> int:
+        """Get the success count in the half-open state."""
+        return self._success_count
+
+    @property
+    def last_failure_time(self) -> float | None:
+        """Get the monotonic time of the last failure."""
+        return self._last_failure_time
 
     def _check_state_transition(self) -> None:
         """Check if state should transition."""
         now = time.monotonic()
 
-        if self._state == CircuitState.OPEN and self._opened_at is not None:
+        if self._state is CircuitState.OPEN and self._opened_at is not None:
             # Check if cooldown has passed
             elapsed = now - self._opened_at
             if elapsed >= self._config.cooldown_seconds:
@@ -161,44 +229,43 @@ class CircuitBreaker:
         Args:
             new_state: Target state
         """
-        if new_state == self._state:
+        if new_state is self._state:
             return
 
         self._state = new_state
-        self._stats.state_changes += 1
+        self._state_changes += 1
 
-        if new_state == CircuitState.OPEN:
+        if new_state is CircuitState.OPEN:
             self._opened_at = time.monotonic()
-        elif new_state == CircuitState.HALF_OPEN:
+        elif new_state is CircuitState.HALF_OPEN:
             self._success_count = 0
-        elif new_state == CircuitState.CLOSED:
+        elif new_state is CircuitState.CLOSED:
             self._failure_count = 0
             self._opened_at = None
 
     def _record_success(self) -> None:
         """Record a successful operation."""
-        self._stats.successful_requests += 1
-        self._stats.last_success_time = time.monotonic()
+        self._successful_requests += 1
+        self._last_success_time = time.monotonic()
 
-        if self._state == CircuitState.HALF_OPEN:
+        if self._state is CircuitState.HALF_OPEN:
             self._success_count += 1
             if self._success_count >= self._config.success_threshold:
                 self._transition_to(CircuitState.CLOSED)
-        elif self._state == CircuitState.CLOSED:
+        elif self._state is CircuitState.CLOSED:
             # Reset failure count on success
             self._failure_count = max(0, self._failure_count - 1)
 
     def _record_failure(self) -> None:
         """Record a failed operation."""
         now = time.monotonic()
-        self._stats.failed_requests += 1
-        self._stats.last_failure_time = now
+        self._failed_requests += 1
         self._last_failure_time = now
 
-        if self._state == CircuitState.HALF_OPEN:
+        if self._state is CircuitState.HALF_OPEN:
             # Single failure in half-open trips back to open
             self._transition_to(CircuitState.OPEN)
-        elif self._state == CircuitState.CLOSED:
+        elif self._state is CircuitState.CLOSED:
             self._failure_count += 1
             if self._failure_count >= self._config.failure_threshold:
                 self._transition_to(CircuitState.OPEN)
@@ -209,23 +276,85 @@ class CircuitBreaker:
         Returns:
             Seconds until retry, or None if not open
         """
-        if self._state != CircuitState.OPEN or self._opened_at is None:
+        if self._state is not CircuitState.OPEN or self._opened_at is None:
             return None
 
         elapsed = time.monotonic() - self._opened_at
         remaining = self._config.cooldown_seconds - elapsed
         return max(0, remaining)
 
+    def cooldown_remaining_ms(self) -> int | None:
+        """Get the remaining open-state cooldown in milliseconds.
+
+        Returns:
+            Milliseconds until the circuit turns half-open, or None if not open
+        """
+        remaining = self.get_time_until_retry()
+        if remaining is None:
+            return None
+        return int(remaining * 1000)
+
+    @property
+    def cache_enabled(self) -> bool:
+        """Check if result caching is configured."""
+        return self._config.cache_enabled and self._config.cache_ttl_s > 0
+
+    def get_cached(self, key: Hashable) -> tuple[bool, Any]:
+        """Look up a cached result.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (hit, value); always a miss when caching is disabled
+        """
+        if not self.cache_enabled:
+            return False, None
+        entry = self._cache.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._cache.move_to_end(key)
+                self._cache_hits += 1
+                return True, entry[1]
+            del self._cache[key]
+        self._cache_misses += 1
+        return False, None
+
+    def store_cached(self, key: Hashable, value: Any) -> None:
+        """Store a successful result (no-op when caching is disabled).
+
+        Args:
+            key: Cache key
+            value: Result to cache
+        """
+        if not self.cache_enabled:
+            return
+        self._cache[key] = (time.monotonic() + self._config.cache_ttl_s, value)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._config.cache_max_entries:
+            self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Drop all cached results."""
+        self._cache.clear()
+
     async def execute(
         self,
         operation: Callable[[], Awaitable[T]],
         fallback: Callable[[], Awaitable[T]] | None = None,
+        cache_key: Hashable | None = None,
     ) -> T:
         """Execute an operation through the circuit breaker.
 
+        When result caching is enabled and a ``cache_key`` is given, a
+        fresh cached result is returned without touching the circuit
+        state or running the operation. Only use this for idempotent
+        calls.
+
         Args:
             operation: Async operation to execute
             fallback: Optional fallback if circuit is open
+            cache_key: Optional key identifying an idempotent call
 
         Returns:
             Operation result
@@ -233,35 +362,84 @@ class CircuitBreaker:
         Raises:
             CircuitOpenError: If circuit is open and no fallback
         """
-        async with self._lock:
-            self._check_state_transition()
-            self._stats.total_requests += 1
+        if cache_key is not None:
+            hit, cached = self.get_cached(cache_key)
+            if hit:
+                return cast("T", cached)
 
-            if self._state == CircuitState.OPEN:
-                self._stats.rejected_requests += 1
-                if fallback:
-                    return await fallback()
-                raise CircuitOpenError(time_until_retry=self.get_time_until_retry())
+        self._check_state_transition()
+        self._total_requests += 1
+
+        if self._state is CircuitState.OPEN:
+            self._rejected_requests += 1
+            if fallback:
+                return await fallback()
+            raise CircuitOpenError(time_until_retry=self.get_time_until_retry())
 
         # Execute operation
         try:
-            if self._state == CircuitState.HALF_OPEN:
+            if self._state is CircuitState.HALF_OPEN:
                 # Limit concurrent requests in half-open state
                 async with self._half_open_semaphore:
                     result = await self._execute_with_timeout(operation)
             else:
                 result = await self._execute_with_timeout(operation)
 
-            async with self._lock:
-                self._record_success()
+            self._record_success()
 
+            if cache_key is not None:
+                self.store_cached(cache_key, result)
             return result
 
         except Exception:
-            async with self._lock:
-                self._record_failure()
+            self._record_failure()
+            raise
+
+    async def execute_fast(self, operation: Callable[[], Awaitable[T]]) -> T:
+        """Execute an operation with minimal bookkeeping on the healthy path.
+
+        While the circuit is closed with no recorded failures, the
+        operation runs directly and successes are counted in batches.
+        Any other state goes through :meth:`execute`, and a failure is
+        recorded exactly as :meth:`execute` would record it.
+
+        Args:
+            operation: Async operation to execute
+
+        Returns:
+            Operation result
+
+        Raises:
+            CircuitOpenError: If circuit is open
+        """
+        if (
+            self._state is not CircuitState.CLOSED
+            or self._failure_count
+            or self._opened_at is not None
+        ):
+            return await self.execute(operation)
+
+        try:
+            result = await self._execute_with_timeout(operation)
+        except Exception:
+            self._total_requests += 1
+            self._record_failure()
             raise
 
+        self._happy_count += 1
+        self._last_success_time = time.monotonic()
+        if self._happy_count >= _FAST_PATH_FLUSH_INTERVAL:
+            self._flush_fast_path()
+        return result
+
+    def _flush_fast_path(self) -> None:
+        """Fold batched happy-path successes into the statistics."""
+        count = self._happy_count
+        if count:
+            self._happy_count = 0
+            self._total_requests += count
+            self._successful_requests += count
+
     async def _execute_with_timeout(self, operation: Callable[[], Awaitable[T]]) -> T:
         """Execute operation with optional timeout.
 
@@ -272,6 +450,11 @@ class CircuitBreaker:
             Operation result
         """
         if self._config.timeout_seconds:
+            if sys.version_info >= (3, 11):
+                # asyncio.timeout runs the operation in the current task,
+                # avoiding the extra Task (and context copy) of wait_for.
+                async with asyncio.timeout(self._config.timeout_seconds):
+                    return await operation()
             return await asyncio.wait_for(
                 operation(),
                 timeout=self._config.timeout_seconds,
@@ -291,14 +474,17 @@ class CircuitBreaker:
         Returns:
             CircuitStats with current statistics
         """
+        self._flush_fast_path()
         return CircuitStats(
-            total_requests=self._stats.total_requests,
-            successful_requests=self._stats.successful_requests,
-            failed_requests=self._stats.failed_requests,
-            rejected_requests=self._stats.rejected_requests,
-            state_changes=self._stats.state_changes,
-            last_failure_time=self._stats.last_failure_time,
-            last_success_time=self._stats.last_success_time,
+            total_requests=self._total_requests,
+            successful_requests=self._successful_requests,
+            failed_requests=self._failed_requests,
+            rejected_requests=self._rejected_requests,
+            state_changes=self._state_changes,
+            last_failure_time=self._last_failure_time,
+            last_success_time=self._last_success_time,
+            cache_hits=self._cache_hits,
+            cache_misses=self._cache_misses,
         )
 
     def __repr__(self) -> str:
@@ -9,6 +9,7 @@ retry, rate limiting, circuit breaking, and backpressure.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import partial
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 from ai_lib_python.resilience.backpressure import Backpressure, BackpressureConfig
@@ -20,12 +21,12 @@ from ai_lib_python.resilience.rate_limiter import RateLimiter, RateLimiterConfig
 from ai_lib_python.resilience.retry import RetryConfig, RetryPolicy, RetryResult
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Hashable
 
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(slots=True)
 class ResilientConfig:
     """Combined configuration for all resilience patterns.
 
@@ -74,7 +75,7 @@ class ResilientConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionStats:
     """Statistics from a resilient execution.
 
@@ -102,37 +103,59 @@ class ResilientExecutor:
     3. Circuit breaker
     4. Retry with exponential backoff
 
+    Executors that target the same upstream can be given the same
+    circuit breaker, rate limiter or backpressure controller, so
+    failures seen by any of them protect all of them. A component passed
+    in is used as is, in place of one built from the config.
+
     Example:
         >>> config = ResilientConfig.production()
         >>> executor = ResilientExecutor(config)
         >>> result = await executor.execute(async_operation)
     """
 
+    __slots__ = (
+        "_backpressure",
+        "_circuit_breaker",
+        "_config",
+        "_name",
+        "_rate_limiter",
+        "_retry",
+    )
+
     def __init__(
         self,
         config: ResilientConfig | None = None,
         name: str = "default",
+        *,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        backpressure: Backpressure | None = None,
     ) -> None:
         """Initialize resilient executor.
 
         Args:
             config: Combined resilience configuration
             name: Identifier for this executor
+            rate_limiter: Optional rate limiter shared with other executors
+            circuit_breaker: Optional circuit breaker shared with other executors
+            backpressure: Optional backpressure controller shared with other executors
         """
         self._config = config or ResilientConfig()
         self._name = name
 
         # Initialize components
-        self._retry = RetryPolicy(self._config.retry) if self._config.retry else None
-        self._rate_limiter = (
-            RateLimiter(self._config.rate_limit) if self._config.rate_limit else None
-        )
-        self._circuit_breaker = (
-            CircuitBreaker(self._config.circuit_breaker) if self._config.circuit_breaker else None
-        )
-        self._backpressure = (
-            Backpressure(self._config.backpressure) if self._config.backpressure else None
-        )
+        cfg = self._config
+        self._retry = RetryPolicy(cfg.retry) if cfg.retry else None
+        if rate_limiter is None and cfg.rate_limit:
+            rate_limiter = RateLimiter.from_config(cfg.rate_limit)
+        if circuit_breaker is None and cfg.circuit_breaker:
+            circuit_breaker = CircuitBreaker(cfg.circuit_breaker)
+        if backpressure is None and cfg.backpressure:
+            backpressure = Backpressure(cfg.backpressure)
+        self._rate_limiter = rate_limiter
+        self._circuit_breaker = circuit_breaker
+        self._backpressure = backpressure
 
     @property
     def name(self) -> str:
@@ -157,12 +180,15 @@ class ResilientExecutor:
         self,
         operation: Callable[[], Awaitable[T]],
         on_retry: Callable[[int, Exception, float], None] | None = None,
+        cache_key: Hashable | None = None,
     ) -> T:
         """Execute an operation with all resilience patterns.
 
         Args:
             operation: Async operation to execute
             on_retry: Optional callback on retry
+            cache_key: Optional key for the circuit breaker's result cache
+                (only used for idempotent calls when caching is enabled)
 
         Returns:
             Operation result
@@ -171,19 +197,57 @@ class ResilientExecutor:
             CircuitOpenError: If circuit is open
             Exception: Original exception if all retries fail
         """
-        # 1. Backpressure control
-        if self._backpressure:
-            async with self._backpressure.acquire():
-                return await self._execute_inner(operation, on_retry)
-        else:
-            return await self._execute_inner(operation, on_retry)
+        # 0. A cached result for an idempotent call skips every other layer
+        breaker = self._circuit_breaker
+        if cache_key is not None and breaker is not None:
+            hit, cached = breaker.get_cached(cache_key)
+            if hit:
+                return cast("T", cached)
+
+        # 1. Backpressure + 2. Rate limiting
+        await self._admit()
+        try:
+            result = await self._execute_guarded(operation, on_retry)
+        finally:
+            if self._backpressure is not None:
+                self._backpressure.release()
+
+        if cache_key is not None and breaker is not None:
+            breaker.store_cached(cache_key, result)
+        return result
+
+    async def _admit(self) -> float:
+        """Take a backpressure permit and a rate-limit token.
+
+        When both are available right away they are taken synchronously,
+        so admission costs no event-loop round-trip. Otherwise this waits
+        for the permit first and then for the token. On return the caller
+        holds a backpressure permit (if backpressure is enabled) and must
+        release it.
 
-    async def _execute_inner(
+        Returns:
+            Time spent waiting for the rate limiter, in seconds
+        """
+        backpressure = self._backpressure
+        if backpressure is not None and not backpressure.try_acquire_nowait():
+            await backpressure.acquire_many(1)
+
+        limiter = self._rate_limiter
+        if limiter is None or limiter.try_acquire_nowait():
+            return 0.0
+        try:
+            return await limiter.acquire()
+        except BaseException:
+            if backpressure is not None:
+                backpressure.release()
+            raise
+
+    async def _execute_guarded(
         self,
         operation: Callable[[], Awaitable[T]],
         on_retry: Callable[[int, Exception, float], None] | None = None,
     ) -> T:
-        """Execute with rate limiting, circuit breaker, and retry.
+        """Execute with circuit breaker and retry.
 
         Args:
             operation: Async operation
@@ -192,14 +256,13 @@ class ResilientExecutor:
         Returns:
             Operation result
         """
-        # 2. Rate limiting
-        if self._rate_limiter:
-            await self._rate_limiter.acquire()
-
         # 3. Circuit breaker + 4. Retry
         if self._circuit_breaker:
+            if self._retry is None:
+                # Nothing to wrap: hand the operation straight to the breaker
+                return await self._circuit_breaker.execute(operation)
             return await self._circuit_breaker.execute(
-                lambda: self._execute_with_retry(operation, on_retry)
+                partial(self._execute_with_retry, operation, on_retry)
             )
         else:
             return await self._execute_with_retry(operation, on_retry)
@@ -249,12 +312,14 @@ class ResilientExecutor:
         )
 
         try:
-            # 1. Backpressure
-            if self._backpressure:
-                async with self._backpressure.acquire():
-                    result = await self._execute_inner_with_stats(operation, on_retry, stats)
-            else:
-                result = await self._execute_inner_with_stats(operation, on_retry, stats)
+            # Backpressure + Rate limiting
+            wait_time = await self._admit()
+            stats.rate_limit_wait_ms = wait_time * 1000
+            try:
+                result = await self._execute_guarded_with_stats(operation, on_retry, stats)
+            finally:
+                if self._backpressure is not None:
+                    self._backpressure.release()
 
             stats.success = True
             return result, stats
@@ -263,7 +328,7 @@ class ResilientExecutor:
             stats.success = False
             raise
 
-    async def _execute_inner_with_stats(
+    async def _execute_guarded_with_stats(
         self,
         operation: Callable[[], Awaitable[T]],
         on_retry: Callable[[int, Exception, float], None] | None,
@@ -279,10 +344,6 @@ class ResilientExecutor:
         Returns:
             Operation result
         """
-        # Rate limiting
-        if self._rate_limiter:
-            wait_time = await self._rate_limiter.acquire()
-            stats.rate_limit_wait_ms = wait_time * 1000
 
         # Circuit breaker + Retry
         async def inner() -> T:
@@ -7,18 +7,32 @@ Provides automatic failover between multiple AI providers/models.
 from __future__ import annotations
 
 import asyncio
+import bisect
+import sys
+import time
 from dataclasses import dataclass, field
+from enum import Enum
 from typing import TYPE_CHECKING, Any, TypeVar
 
-from ai_lib_python.errors import AiLibError, is_fallbackable
+from ai_lib_python.errors import AiLibError, ErrorClass, is_fallbackable
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+
+    from ai_lib_python.resilience.backpressure import Backpressure
 
 T = TypeVar("T")
 
+# Error classes that allow falling back, classified once at import time
+_is_fallbackable_class = frozenset(c for c in ErrorClass if is_fallbackable(c)).__contains__
+
+
+def _priority_key(target: FallbackTarget) -> float:
+    """Sort key placing higher-weight targets first."""
+    return -target.weight
+
 
-@dataclass
+@dataclass(slots=True)
 class FallbackTarget:
     """A target in the fallback chain.
 
@@ -27,15 +41,24 @@ class FallbackTarget:
         operation: Async operation factory
         weight: Priority weight (higher = preferred)
         enabled: Whether this target is enabled
+        timeout_ms: Timeout for one call to this target (overrides the chain default)
     """
 
     name: str
     operation: Callable[..., Awaitable[Any]]
     weight: float = 1.0
     enabled: bool = True
+    timeout_ms: float | None = None
+
+
+class FallbackStrategy(str, Enum):
+    """How a fallback chain moves between targets."""
+
+    SERIAL = "serial"
+    HEDGED = "hedged"
 
 
-@dataclass
+@dataclass(slots=True)
 class FallbackConfig:
     """Configuration for fallback chain.
 
@@ -43,14 +66,39 @@ class FallbackConfig:
         retry_all: Whether to retry all targets on failure
         max_attempts_per_target: Max attempts per target before fallback
         delay_between_targets_ms: Delay between fallback attempts
+        strategy: Serial (wait for each target to fail) or hedged (race targets)
+        hedge_delay_ms: In hedged mode, how long to wait on the running
+            targets before also starting the next one
+        per_target_timeout_ms: Default timeout for one call to a target
+            (None = no timeout). Wrap execute() in asyncio.wait_for to bound
+            the whole chain instead.
+        failure_cooldown_ms: How long a target that failed is moved behind
+            the healthy targets (0 = keep the static weight order)
     """
 
     retry_all: bool = True
     max_attempts_per_target: int = 1
     delay_between_targets_ms: int = 0
+    strategy: FallbackStrategy = FallbackStrategy.SERIAL
+    hedge_delay_ms: int = 0
+    per_target_timeout_ms: float | None = None
+    failure_cooldown_ms: int = 0
 
 
-@dataclass
+class TargetTimeoutError(AiLibError):
+    """Raised when a fallback target does not answer within its timeout.
+
+    Classified as a timeout, so the chain falls back to the next target.
+    """
+
+    def __init__(self, target: str, timeout_ms: float) -> None:
+        super().__init__(f"Fallback target '{target}' timed out after {timeout_ms:g}ms")
+        self.target = target
+        self.timeout_ms = timeout_ms
+        self.error_class = ErrorClass.TIMEOUT
+
+
+@dataclass(slots=True)
 class FallbackResult:
     """Result of a fallback chain execution.
 
@@ -90,6 +138,10 @@ class FallbackChain:
         """
         self._config = config or FallbackConfig()
         self._targets: list[FallbackTarget] = []
+        # Enabled targets in priority order; rebuilt lazily after changes
+        self._sorted_cache: list[FallbackTarget] | None = None
+        # Target name -> monotonic time of its last failure (failure_cooldown_ms)
+        self._failed_at: dict[str, float] = {}
 
     def add_target(
         self,
@@ -97,6 +149,7 @@ class FallbackChain:
         operation: Callable[..., Awaitable[Any]],
         weight: float = 1.0,
         enabled: bool = True,
+        timeout_ms: float | None = None,
     ) -> FallbackChain:
         """Add a target to the fallback chain.
 
@@ -105,18 +158,24 @@ class FallbackChain:
             operation: Async operation factory
             weight: Priority weight
             enabled: Whether target is enabled
+            timeout_ms: Optional per-call timeout for this target
 
         Returns:
             Self for chaining
         """
-        self._targets.append(
+        # Keep targets in priority order; equal weights keep insertion order
+        bisect.insort(
+            self._targets,
             FallbackTarget(
                 name=name,
                 operation=operation,
                 weight=weight,
                 enabled=enabled,
-            )
+                timeout_ms=timeout_ms,
+            ),
+            key=_priority_key,
         )
+        self._sorted_cache = None
         return self
 
     def remove_target(self, name: str) -> bool:
@@ -131,6 +190,7 @@ class FallbackChain:
         for i, target in enumerate(self._targets):
             if target.name == name:
                 self._targets.pop(i)
+                self._sorted_cache = None
                 return True
         return False
 
@@ -147,22 +207,30 @@ class FallbackChain:
         for target in self._targets:
             if target.name == name:
                 target.enabled = enabled
+                self._sorted_cache = None
                 return True
         return False
 
+    def _get_sorted(self) -> list[FallbackTarget]:
+        """Get enabled targets sorted by weight (descending).
+
+        Targets are stored in priority order, so this only filters. The
+        result is cached until targets are added, removed, or toggled.
+
+        Returns:
+            Enabled targets in priority order
+        """
+        if self._sorted_cache is None:
+            self._sorted_cache = [t for t in self._targets if t.enabled]
+        return self._sorted_cache
+
     def get_targets(self) -> list[str]:
         """Get list of target names in priority order.
 
         Returns:
             List of target names
         """
-        # Sort by weight (descending)
-        sorted_targets = sorted(
-            [t for t in self._targets if t.enabled],
-            key=lambda t: t.weight,
-            reverse=True,
-        )
-        return [t.name for t in sorted_targets]
+        return [t.name for t in self._get_sorted()]
 
     def _should_fallback(self, error: Exception) -> bool:
         """Check if error should trigger fallback.
@@ -174,12 +242,47 @@ class FallbackChain:
             True if should fallback
         """
         # Check if error has error_class
-        if hasattr(error, "error_class"):
-            return is_fallbackable(error.error_class)
+        error_class = getattr(error, "error_class", None)
+        if error_class is not None:
+            return _is_fallbackable_class(error_class)
 
         # Default: fallback on any AiLibError
         return isinstance(error, AiLibError)
 
+    async def _call_target(
+        self,
+        target: FallbackTarget,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Call a target's operation, applying its timeout.
+
+        Args:
+            target: Target to call
+            args: Arguments to pass to the operation
+            kwargs: Keyword arguments to pass to the operation
+
+        Returns:
+            Operation result
+
+        Raises:
+            TargetTimeoutError: If the target exceeds its timeout
+        """
+        timeout_ms = target.timeout_ms
+        if timeout_ms is None:
+            timeout_ms = self._config.per_target_timeout_ms
+        if timeout_ms is None:
+            return await target.operation(*args, **kwargs)
+
+        try:
+            if sys.version_info >= (3, 11):
+                # Same task as the caller; wait_for would wrap it in a new Task
+                async with asyncio.timeout(timeout_ms / 1000):
+                    return await target.operation(*args, **kwargs)
+            return await asyncio.wait_for(target.operation(*args, **kwargs), timeout_ms / 1000)
+        except asyncio.TimeoutError:
+            raise TargetTimeoutError(target.name, timeout_ms) from None
+
     async def execute(
         self,
         *args: Any,
@@ -197,11 +300,7 @@ class FallbackChain:
             FallbackResult with outcome
         """
         # Get enabled targets sorted by weight
-        targets = sorted(
-            [t for t in self._targets if t.enabled],
-            key=lambda t: t.weight,
-            reverse=True,
-        )
+        targets = self._get_sorted()
 
         if not targets:
             return FallbackResult(
@@ -209,16 +308,124 @@ class FallbackChain:
                 errors={"_chain": ValueError("No enabled targets in chain")},
             )
 
+        if self._failed_at:
+            targets = self._demote_recently_failed(targets)
+
+        if self._config.strategy == FallbackStrategy.HEDGED:
+            result = await self._execute_hedged(targets, args, kwargs, on_fallback)
+        else:
+            result = await self._execute_serial(targets, args, kwargs, on_fallback)
+
+        if self._config.failure_cooldown_ms > 0:
+            self._record_outcome(result)
+        return result
+
+    async def execute_stream(
+        self,
+        calls: Iterable[tuple[tuple[Any, ...], dict[str, Any]]],
+        backpressure: Backpressure | None = None,
+    ) -> AsyncIterator[FallbackResult]:
+        """Execute a sequence of calls through the chain.
+
+        When ``backpressure`` is given, a single permit is held for the
+        whole stream instead of one per call, so a burst of correlated
+        requests waits for admission once. This trades fairness for
+        throughput: other tasks queue behind the stream until it finishes.
+        Consume the stream fully (or close it) to return the permit.
+
+        Args:
+            calls: (args, kwargs) pairs, one per request
+            backpressure: Optional controller to lease one permit from
+
+        Yields:
+            FallbackResult for each call, in order
+
+        Raises:
+            BackpressureError: If the permit cannot be acquired in time
+        """
+        if backpressure is None:
+            for args, kwargs in calls:
+                yield await self.execute(*args, **kwargs)
+            return
+
+        async with backpressure.acquire():
+            for args, kwargs in calls:
+                yield await self.execute(*args, **kwargs)
+
+    def _demote_recently_failed(self, targets: list[FallbackTarget]) -> list[FallbackTarget]:
+        """Move targets still in their failure cooldown behind the others.
+
+        Order within each group follows weight, so a demoted target is
+        still tried, just after the healthy ones.
+
+        Args:
+            targets: Enabled targets in priority order
+
+        Returns:
+            Targets in the order they should be tried
+        """
+        deadline = time.monotonic() - self._config.failure_cooldown_ms / 1000
+        for name, failed_at in list(self._failed_at.items()):
+            if failed_at <= deadline:
+                del self._failed_at[name]
+        if not self._failed_at:
+            return targets
+
+        cooling = self._failed_at
+        healthy = [t for t in targets if t.name not in cooling]
+        return healthy + [t for t in targets if t.name in cooling]
+
+    def _record_outcome(self, result: FallbackResult) -> None:
+        """Remember which targets failed for failure-cooldown ordering.
+
+        Args:
+            result: Outcome of an execution
+        """
+        now = time.monotonic()
+        for name in result.errors:
+            self._failed_at[name] = now
+        if result.target_used is not None:
+            self._failed_at.pop(result.target_used, None)
+
+    async def _execute_serial(
+        self,
+        targets: list[FallbackTarget],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        on_fallback: Callable[[str, str, Exception], None] | None,
+    ) -> FallbackResult:
+        """Try targets one after another until one succeeds.
+
+        Args:
+            targets: Enabled targets in priority order
+            args: Arguments to pass to operations
+            kwargs: Keyword arguments to pass to operations
+            on_fallback: Callback when falling back (from, to, error)
+
+        Returns:
+            FallbackResult with outcome
+        """
         errors: dict[str, Exception] = {}
         targets_tried: list[str] = []
-        last_target: str | None = None
-
-        for target in targets:
+        config = self._config
+        max_attempts = config.max_attempts_per_target
+        delay_ms = config.delay_between_targets_ms
+        default_timeout_ms = config.per_target_timeout_ms
+        should_fallback = self._should_fallback
+        num_targets = len(targets)
+
+        for i, target in enumerate(targets):
             targets_tried.append(target.name)
+            # Untimed targets are awaited directly, without the wrapper frame
+            timed = target.timeout_ms is not None or default_timeout_ms is not None
+            operation = target.operation
 
-            for attempt in range(self._config.max_attempts_per_target):
+            for _ in range(max_attempts):
                 try:
-                    result: Any = await target.operation(*args, **kwargs)
+                    if timed:
+                        result: Any = await self._call_target(target, args, kwargs)
+                    else:
+                        result = await operation(*args, **kwargs)
                     return FallbackResult(
                         success=True,
                         value=result,
@@ -230,7 +437,7 @@ class FallbackChain:
                     errors[target.name] = e
 
                     # Check if should fallback
-                    if not self._should_fallback(e):
+                    if not should_fallback(e):
                         # Non-fallbackable error, stop chain
                         return FallbackResult(
                             success=False,
@@ -238,26 +445,100 @@ class FallbackChain:
                             targets_tried=targets_tried,
                         )
 
-                    # Only retry if more attempts available
-                    if attempt < self._config.max_attempts_per_target - 1:
-                        continue
-                    break
-
-            # Callback before falling back
-            if on_fallback and last_target:
-                next_target = (
-                    targets[targets.index(target) + 1].name
-                    if targets.index(target) + 1 < len(targets)
-                    else None
-                )
-                if next_target:
-                    on_fallback(target.name, next_target, errors[target.name])
-
-            last_target = target.name
+            # Callback before falling back to the next target
+            if on_fallback and i + 1 < num_targets:
+                on_fallback(target.name, targets[i + 1].name, errors[target.name])
 
             # Delay between targets
-            if self._config.delay_between_targets_ms > 0:
-                await asyncio.sleep(self._config.delay_between_targets_ms / 1000)
+            if delay_ms > 0:
+                await asyncio.sleep(delay_ms / 1000)
+
+        # All targets failed
+        return FallbackResult(
+            success=False,
+            errors=errors,
+            targets_tried=targets_tried,
+        )
+
+    async def _execute_hedged(
+        self,
+        targets: list[FallbackTarget],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        on_fallback: Callable[[str, str, Exception], None] | None,
+    ) -> FallbackResult:
+        """Race targets in priority order and return the first success.
+
+        The next target starts when every running target has failed, or
+        when hedge_delay_ms passes without a result. Targets still running
+        when one succeeds are cancelled. Each target is tried once.
+
+        Args:
+            targets: Enabled targets in priority order
+            args: Arguments to pass to operations
+            kwargs: Keyword arguments to pass to operations
+            on_fallback: Callback when a failure starts the next target
+
+        Returns:
+            FallbackResult with outcome
+        """
+        errors: dict[str, Exception] = {}
+        targets_tried: list[str] = []
+        running: dict[asyncio.Future[Any], FallbackTarget] = {}
+        hedge_delay = self._config.hedge_delay_ms / 1000
+        num_targets = len(targets)
+        next_index = 0
+
+        def launch() -> None:
+            nonlocal next_index
+            target = targets[next_index]
+            next_index += 1
+            targets_tried.append(target.name)
+            running[asyncio.ensure_future(self._call_target(target, args, kwargs))] = target
+
+        launch()
+        try:
+            while running:
+                done, _ = await asyncio.wait(
+                    running,
+                    timeout=hedge_delay if next_index < num_targets else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    # Hedge: no answer yet, start the next target alongside
+                    launch()
+                    continue
+
+                for task in done:
+                    target = running.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        return FallbackResult(
+                            success=True,
+                            value=task.result(),
+                            target_used=target.name,
+                            targets_tried=targets_tried,
+                            errors=errors,
+                        )
+                    if not isinstance(error, Exception):
+                        raise error
+                    errors[target.name] = error
+                    if not self._should_fallback(error):
+                        return FallbackResult(
+                            success=False,
+                            errors=errors,
+                            targets_tried=targets_tried,
+                        )
+
+                if not running and next_index < num_targets:
+                    if on_fallback:
+                        on_fallback(target.name, targets[next_index].name, errors[target.name])
+                    launch()
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
 
         # All targets failed
         return FallbackResult(
@@ -282,6 +563,8 @@ class MultiFallback:
     def __init__(self) -> None:
         """Initialize multi-fallback manager."""
         self._chains: dict[str, FallbackChain] = {}
+        # Chain name -> bound chain.execute, resolved once at registration
+        self._handlers: dict[str, Callable[..., Awaitable[FallbackResult]]] = {}
 
     def register_chain(self, name: str, chain: FallbackChain) -> MultiFallback:
         """Register a fallback chain.
@@ -294,6 +577,7 @@ class MultiFallback:
             Self for chaining
         """
         self._chains[name] = chain
+        self._handlers[name] = chain.execute
         return self
 
     def get_chain(self, name: str) -> FallbackChain | None:
@@ -326,11 +610,11 @@ class MultiFallback:
         Raises:
             ValueError: If chain not found
         """
-        chain = self._chains.get(chain_name)
-        if not chain:
+        handler = self._handlers.get(chain_name)
+        if handler is None:
             raise ValueError(f"Unknown fallback chain: {chain_name}")
 
-        return await chain.execute(*args, **kwargs)
+        return await handler(*args, **kwargs)
 
     def list_chains(self) -> list[str]:
         """Get list of registered chain names.
@@ -6,7 +6,8 @@ Provides unified preflight validation before request execution.
 
 from __future__ import annotations
 
-import asyncio
+import logging
+import time
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -18,6 +19,21 @@ if TYPE_CHECKING:
     from ai_lib_python.resilience.circuit_breaker import CircuitBreaker
     from ai_lib_python.resilience.rate_limiter import RateLimiter
 
+logger = logging.getLogger(__name__)
+
+# Common rate-limit header names (lowercase), in lookup order
+_REMAINING_HEADERS = (
+    "x-ratelimit-remaining",
+    "x-ratelimit-remaining-requests",
+    "ratelimit-remaining",
+)
+_RESET_HEADERS = (
+    "x-ratelimit-reset",
+    "x-ratelimit-reset-requests",
+    "ratelimit-reset",
+    "retry-after",
+)
+
 
 class PreflightError(AiLibError):
     """Error raised when preflight check fails."""
@@ -43,14 +59,14 @@ class PreflightError(AiLibError):
         self.retry_after_ms = retry_after_ms
 
 
-@dataclass
+@dataclass(slots=True)
 class PreflightResult:
     """Result of preflight checks.
 
     Attributes:
         passed: Whether all checks passed
         permit: Backpressure permit (if acquired)
-        signals: Current signals snapshot
+        signals: Signals snapshot taken at check time (None if not requested)
         errors: List of failed checks
     """
 
@@ -61,16 +77,17 @@ class PreflightResult:
 
     def release_permit(self) -> None:
         """Release the backpressure permit if held."""
-        if self.permit is not None:
+        permit, self.permit = self.permit, None
+        if permit is not None:
             # Permit is typically an asyncio.Semaphore release
             try:
-                self.permit.release()
-            except (ValueError, RuntimeError):
-                pass
-            self.permit = None
+                permit.release()
+            except (ValueError, RuntimeError) as e:
+                # Over-release usually means the permit was already returned
+                logger.debug("Ignoring failed permit release: %r", e)
 
 
-@dataclass
+@dataclass(slots=True)
 class PreflightConfig:
     """Configuration for preflight checks.
 
@@ -139,107 +156,112 @@ class PreflightChecker:
         self._provider = provider
         self._model = model
 
-    async def check(self) -> PreflightResult:
+    async def check(self, with_signals: bool = True) -> PreflightResult:
         """Perform all preflight checks.
 
+        The local, synchronous checks (circuit breaker and backpressure
+        capacity) run first. The rate limiter, the only check that can
+        wait, runs last, so a request that is going to be rejected does
+        not first wait for or consume a rate-limit token.
+
+        Args:
+            with_signals: Whether to attach a signals snapshot to the result
+                (fail-fast rejections never carry one); callers that do not
+                read it can skip building it
+
         Returns:
             PreflightResult with check status and permit
         """
-        result = PreflightResult()
         errors: list[PreflightError] = []
+        fail_fast = self._config.fail_fast
 
         # 1. Check circuit breaker (fast fail)
         if self._config.check_circuit_breaker and self._circuit_breaker:
-            try:
-                if self._circuit_breaker.is_open:
-                    cooldown = None
-                    retry_after = self._circuit_breaker.get_time_until_retry()
-                    if retry_after is not None and retry_after > 0:
-                        cooldown = int(retry_after * 1000)
-
-                    error = PreflightError(
-                        "Circuit breaker is open",
-                        "circuit_breaker",
-                        retryable=True,
-                        retry_after_ms=cooldown,
-                    )
-                    errors.append(error)
-                    if self._config.fail_fast:
-                        result.passed = False
-                        result.errors = errors
-                        return result
-            except Exception as e:
-                errors.append(
-                    PreflightError(f"Circuit breaker check failed: {e}", "circuit_breaker")
-                )
-                if self._config.fail_fast:
-                    result.passed = False
-                    result.errors = errors
-                    return result
+            error = self._check_circuit_breaker(self._circuit_breaker)
+            if error is not None:
+                errors.append(error)
+                if fail_fast:
+                    return PreflightResult(passed=False, errors=errors)
 
-        # 2. Check rate limiter
-        if self._config.check_rate_limiter and self._rate_limiter:
-            try:
-                allowed = await self._rate_limiter.acquire()
-                if not allowed:
-                    error = PreflightError(
-                        "Rate limit exceeded",
-                        "rate_limiter",
-                        retryable=True,
-                        retry_after_ms=1000,  # Default 1s retry
-                    )
-                    errors.append(error)
-                    if self._config.fail_fast:
-                        result.passed = False
-                        result.errors = errors
-                        return result
-            except Exception as e:
-                errors.append(PreflightError(f"Rate limiter check failed: {e}", "rate_limiter"))
-                if self._config.fail_fast:
-                    result.passed = False
-                    result.errors = errors
-                    return result
-
-        # 3. Acquire backpressure permit
+        # 2. Check backpressure capacity
         if self._config.check_backpressure and self._backpressure:
-            try:
-                if self._backpressure.available_permits <= 0:
-                    error = PreflightError(
-                        "Backpressure limit reached",
-                        "backpressure",
-                        retryable=True,
-                        retry_after_ms=100,
-                    )
-                    errors.append(error)
-                    if self._config.fail_fast:
-                        result.passed = False
-                        result.errors = errors
-                        return result
-            except asyncio.TimeoutError:
-                error = PreflightError(
-                    "Backpressure permit timeout",
+            error = self._check_backpressure(self._backpressure)
+            if error is not None:
+                errors.append(error)
+                if fail_fast:
+                    return PreflightResult(passed=False, errors=errors)
+
+        # 3. Check rate limiter (may wait for a token)
+        if self._config.check_rate_limiter and self._rate_limiter and not (fail_fast and errors):
+            error = await self._check_rate_limiter(self._rate_limiter)
+            if error is not None:
+                errors.append(error)
+                if fail_fast:
+                    return PreflightResult(passed=False, errors=errors)
+
+        signals = self.get_signals() if with_signals else None
+        return PreflightResult(passed=not errors, signals=signals, errors=errors)
+
+    @staticmethod
+    def _check_circuit_breaker(breaker: CircuitBreaker) -> PreflightError | None:
+        """Check whether the circuit breaker lets requests through.
+
+        Args:
+            breaker: Circuit breaker to check
+
+        Returns:
+            PreflightError if the circuit is open, else None
+        """
+        try:
+            if breaker.is_open:
+                cooldown = breaker.cooldown_remaining_ms() or None
+                return PreflightError(
+                    "Circuit breaker is open",
+                    "circuit_breaker",
+                    retryable=True,
+                    retry_after_ms=cooldown,
+                )
+        except Exception as e:
+            return PreflightError(f"Circuit breaker check failed: {e}", "circuit_breaker")
+        return None
+
+    @staticmethod
+    def _check_backpressure(backpressure: Backpressure) -> PreflightError | None:
+        """Check whether backpressure has capacity left.
+
+        Args:
+            backpressure: Backpressure controller to check
+
+        Returns:
+            PreflightError if no permit is available, else None
+        """
+        try:
+            if backpressure.available_permits <= 0:
+                return PreflightError(
+                    "Backpressure limit reached",
                     "backpressure",
                     retryable=True,
                     retry_after_ms=100,
                 )
-                errors.append(error)
-                if self._config.fail_fast:
-                    result.passed = False
-                    result.errors = errors
-                    return result
-            except Exception as e:
-                errors.append(PreflightError(f"Backpressure check failed: {e}", "backpressure"))
-                if self._config.fail_fast:
-                    result.passed = False
-                    result.errors = errors
-                    return result
-
-        # Generate signals snapshot
-        result.signals = self.get_signals()
-        result.errors = errors
-        result.passed = len(errors) == 0
-
-        return result
+        except Exception as e:
+            return PreflightError(f"Backpressure check failed: {e}", "backpressure")
+        return None
+
+    @staticmethod
+    async def _check_rate_limiter(rate_limiter: RateLimiter) -> PreflightError | None:
+        """Wait for a rate-limit token.
+
+        Args:
+            rate_limiter: Rate limiter to acquire from
+
+        Returns:
+            PreflightError if the limiter failed, else None
+        """
+        try:
+            await rate_limiter.acquire()
+        except Exception as e:
+            return PreflightError(f"Rate limiter check failed: {e}", "rate_limiter")
+        return None
 
     def get_signals(self) -> SignalsSnapshot:
         """Get current signals snapshot.
@@ -247,11 +269,7 @@ class PreflightChecker:
         Returns:
             SignalsSnapshot with current state
         """
-        inflight = None
-        if self._backpressure:
-            max_concurrent = self._backpressure._config.max_concurrent
-            in_use = self._backpressure.current_inflight
-            inflight = (max_concurrent, in_use)
+        inflight = self._backpressure.snapshot() if self._backpressure else None
 
         return SignalsSnapshot.from_components(
             inflight=inflight,
@@ -278,47 +296,42 @@ class PreflightChecker:
         if not self._rate_limiter:
             return
 
-        # Common header patterns
-        remaining_headers = [
-            "x-ratelimit-remaining",
-            "x-ratelimit-remaining-requests",
-            "ratelimit-remaining",
-        ]
-        reset_headers = [
-            "x-ratelimit-reset",
-            "x-ratelimit-reset-requests",
-            "ratelimit-reset",
-            "retry-after",
-        ]
-
-        # Try to extract remaining count
+        # Normalize header names once instead of probing each name in two cases
+        lowered = {k.lower(): v for k, v in headers.items()}
+
+        # Try to extract remaining count; plain ASCII digits skip the exception
+        # path (isdigit alone also accepts characters like "²" that int() rejects)
         remaining = None
-        for header in remaining_headers:
-            value = headers.get(header) or headers.get(header.title())
-            if value:
-                try:
-                    remaining = int(value)
-                    break
-                except ValueError:
-                    continue
+        for header in _REMAINING_HEADERS:
+            value = lowered.get(header)
+            if not value:
+                continue
+            if value.isascii() and value.isdigit():
+                remaining = int(value)
+                break
+            try:
+                remaining = int(value)
+                break
+            except ValueError:
+                continue
 
         # Try to extract reset time
         reset_after = None
-        for header in reset_headers:
-            value = headers.get(header) or headers.get(header.title())
-            if value:
+        now = time.time()
+        for header in _RESET_HEADERS:
+            value = lowered.get(header)
+            if not value:
+                continue
+            if value.isascii() and value.replace(".", "", 1).isdigit():
+                val = float(value)
+            else:
                 try:
                     val = float(value)
-                    # Check if it's an epoch timestamp or seconds
-                    if val > 1_000_000_000:
-                        import time
-
-                        reset_after = val - time.time()
-                    else:
-                        reset_after = val
-                    break
                 except ValueError:
                     continue
+            # Check if it's an epoch timestamp or seconds
+            reset_after = val - now if val > 1_000_000_000 else val
+            break
 
         # Update rate limiter if we have useful info
         if remaining is not None or reset_after is not None:
@@ -363,15 +376,17 @@ class PreflightContext:
         exc_tb: Any,
     ) -> None:
         """Exit context and release permit."""
-        if self._result:
-            self._result.release_permit()
+        result = self._result
+        if result is None:
+            return
 
-            # Report outcome
+        try:
+            # Report outcome; success is reported explicitly by caller
             if exc_val is not None:
                 self._checker.on_failure()
-            elif self._result.passed:
-                # Success is reported explicitly by caller
-                pass
+        finally:
+            # Release even if reporting fails or the task is being cancelled
+            result.release_permit()
 
     @property
     def passed(self) -> bool:
@@ -7,7 +7,9 @@ Provides both static and adaptive rate limiting based on provider response heade
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import time
+from collections import deque
 from dataclasses import dataclass
 from typing import Any
 
@@ -71,12 +73,46 @@ class RateLimiter:
     - Requests consume tokens
     - If no tokens available, requests wait
 
+    Token accounting is synchronous and never spans an ``await``, so the
+    limiter is safe to share between tasks on one event loop without a
+    lock. It is not thread-safe.
+
     Example:
         >>> limiter = RateLimiter(RateLimiterConfig.from_rps(10))
         >>> await limiter.acquire()  # Wait if needed
         >>> # Make request
     """
 
+    __slots__ = (
+        "_config",
+        "_last_refill_ns",
+        "_max_tokens",
+        "_ns_per_token",
+        "_rate",
+        "_tokens",
+        "_waiters",
+        "_wake_handle",
+    )
+
+    @classmethod
+    def from_config(cls, config: RateLimiterConfig | None = None) -> RateLimiter:
+        """Create a limiter for a configuration.
+
+        Unlimited configurations get a no-op limiter that skips the
+        token bucket entirely. Subclasses are never specialized, since
+        they may raise the rate later (AdaptiveRateLimiter does, from
+        response headers).
+
+        Args:
+            config: Rate limiter configuration
+
+        Returns:
+            RateLimiter instance
+        """
+        if cls is RateLimiter and (config is None or config.requests_per_second <= 0):
+            return _UnlimitedRateLimiter(config)
+        return cls(config)
+
     def __init__(self, config: RateLimiterConfig | None = None) -> None:
         """Initialize rate limiter.
 
@@ -84,32 +120,74 @@ class RateLimiter:
             config: Rate limiter configuration
         """
         self._config = config or RateLimiterConfig()
-        self._lock = asyncio.Lock()
 
-        # Token bucket state
-        self._tokens = float(
+        # Token bucket state, in whole tokens and integer nanoseconds so
+        # partial refills carry over exactly between calls
+        self._tokens = int(
             self._config.initial_tokens
             if self._config.initial_tokens is not None
             else (self._config.burst_size or 1)
         )
-        self._max_tokens = float(self._config.burst_size or 1)
-        self._last_refill = time.monotonic()
+        self._max_tokens = int(self._config.burst_size or 1)
+        self._last_refill_ns = time.monotonic_ns()
+
+        # Rate (tokens per second) and its reciprocal in ns per token
+        self._rate = 0.0
+        self._ns_per_token = 0
+        self._set_rate(self._config.requests_per_second)
+
+        # Tasks queued in acquire() and the timer that serves them
+        self._waiters: deque[tuple[int, asyncio.Future[None]]] = deque()
+        self._wake_handle: asyncio.TimerHandle | None = None
+
+    def _set_rate(self, rate: float) -> None:
+        """Set the refill rate.
+
+        Args:
+            rate: Tokens per second (0 = unlimited)
+        """
+        self._rate = rate
+        self._ns_per_token = max(1, int(1e9 / rate)) if rate > 0 else 0
 
-        # Rate (tokens per second)
-        self._rate = self._config.requests_per_second
+    def _refill(self) -> int:
+        """Refill whole tokens based on elapsed time.
 
-    def _refill(self) -> None:
-        """Refill tokens based on elapsed time."""
+        Time that has not yet added up to a full token is kept, so it
+        counts towards the next refill.
+
+        Returns:
+            Monotonic time of the refill in nanoseconds (0 if unlimited)
+        """
         if self._rate <= 0:
-            return
+            return 0
+
+        now = time.monotonic_ns()
+        period = self._ns_per_token
+        new_tokens = (now - self._last_refill_ns) // period
+        if new_tokens:
+            tokens = self._tokens + new_tokens
+            max_tokens = self._max_tokens
+            if tokens >= max_tokens:
+                # Full bucket: leftover time cannot add anything
+                self._tokens = max_tokens
+                self._last_refill_ns = now
+            else:
+                self._tokens = tokens
+                self._last_refill_ns += new_tokens * period
+        return now
+
+    def _seconds_until(self, tokens: int, now: int) -> float:
+        """Get the time until the bucket holds ``tokens``, just after a refill.
 
-        now = time.monotonic()
-        elapsed = now - self._last_refill
-        self._last_refill = now
+        Args:
+            tokens: Number of tokens needed
+            now: Time of the refill in nanoseconds
 
-        # Add tokens based on elapsed time
-        new_tokens = elapsed * self._rate
-        self._tokens = min(self._tokens + new_tokens, self._max_tokens)
+        Returns:
+            Wait time in seconds
+        """
+        deficit = tokens - self._tokens
+        return (deficit * self._ns_per_token - (now - self._last_refill_ns)) / 1e9
 
     async def acquire(self, tokens: int = 1) -> float:
         """Acquire tokens, waiting if necessary.
@@ -123,23 +201,96 @@ class RateLimiter:
         if self._rate <= 0:
             return 0.0  # Unlimited
 
-        async with self._lock:
+        # A request larger than the bucket is admitted once it is full
+        needed = min(tokens, self._max_tokens)
+        if not self._waiters:
             self._refill()
+            if self._tokens >= needed:
+                self._tokens -= tokens
+                return 0.0
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        waiter: asyncio.Future[None] = loop.create_future()
+        entry = (tokens, waiter)
+        self._waiters.append(entry)
+        if self._wake_handle is None:
+            self._dispatch()
+
+        try:
+            await waiter
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                # The tokens were handed over just as we were cancelled
+                self._tokens = min(self._tokens + tokens, self._max_tokens)
+            else:
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(entry)
+            self._reschedule()
+            raise
+        return loop.time() - started
+
+    def _dispatch(self) -> None:
+        """Hand refilled tokens to queued waiters in FIFO order.
+
+        Every waiter the bucket can cover is served in one pass, and a
+        single timer is armed for the next one, instead of each waiter
+        sleeping and re-checking on its own.
+        """
+        self._wake_handle = None
+        waiters = self._waiters
+        if self._rate <= 0:
+            # Limit lifted while tasks were queued: release all of them
+            while waiters:
+                _, waiter = waiters.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
+            return
+        now = self._refill()
+        while waiters:
+            tokens, waiter = waiters[0]
+            if waiter.done():
+                waiters.popleft()
+                continue
+            needed = min(tokens, self._max_tokens)
+            if self._tokens < needed:
+                delay = self._seconds_until(needed, now)
+                self._wake_handle = asyncio.get_running_loop().call_later(delay, self._dispatch)
+                return
+            waiters.popleft()
+            self._tokens -= tokens
+            waiter.set_result(None)
+
+    def _reschedule(self) -> None:
+        """Re-run dispatch after the waiter queue changed."""
+        if self._wake_handle is not None:
+            self._wake_handle.cancel()
+            self._wake_handle = None
+        if self._waiters:
+            self._dispatch()
 
-            wait_time = 0.0
+    def try_acquire_nowait(self, tokens: int = 1) -> bool:
+        """Try to acquire tokens without waiting, from synchronous code.
 
-            if self._tokens < tokens:
-                # Calculate wait time
-                deficit = tokens - self._tokens
-                wait_time = deficit / self._rate
+        Never consumes while other tasks are waiting in :meth:`acquire`,
+        so they are not overtaken.
 
-                # Wait for tokens
-                await asyncio.sleep(wait_time)
-                self._refill()
+        Args:
+            tokens: Number of tokens to consume
 
-            # Consume tokens
+        Returns:
+            True if the tokens were consumed
+        """
+        if self._rate <= 0:
+            return True
+        if self._waiters:
+            return False
+
+        self._refill()
+        if self._tokens >= tokens:
             self._tokens -= tokens
-            return wait_time
+            return True
+        return False
 
     async def try_acquire(self, tokens: int = 1) -> bool:
         """Try to acquire tokens without waiting.
@@ -150,16 +301,7 @@ class RateLimiter:
         Returns:
             True if acquired, False if would need to wait
         """
-        if self._rate <= 0:
-            return True  # Unlimited
-
-        async with self._lock:
-            self._refill()
-
-            if self._tokens >= tokens:
-                self._tokens -= tokens
-                return True
-            return False
+        return self.try_acquire_nowait(tokens)
 
     def get_wait_time(self, tokens: int = 1) -> float:
         """Get estimated wait time without acquiring.
@@ -173,13 +315,12 @@ class RateLimiter:
         if self._rate <= 0:
             return 0.0
 
-        self._refill()
+        now = self._refill()
 
         if self._tokens >= tokens:
             return 0.0
 
-        deficit = tokens - self._tokens
-        return deficit / self._rate
+        return self._seconds_until(tokens, now)
 
     @property
     def available_tokens(self) -> float:
@@ -193,6 +334,33 @@ class RateLimiter:
         return self._rate > 0
 
 
+class _UnlimitedRateLimiter(RateLimiter):
+    """RateLimiter with no rate limit; every request passes immediately."""
+
+    __slots__ = ()
+
+    async def acquire(self, tokens: int = 1) -> float:  # noqa: ARG002
+        """Acquire tokens; never waits."""
+        return 0.0
+
+    def try_acquire_nowait(self, tokens: int = 1) -> bool:  # noqa: ARG002
+        """Try to acquire tokens; always succeeds."""
+        return True
+
+    async def try_acquire(self, tokens: int = 1) -> bool:  # noqa: ARG002
+        """Try to acquire tokens; always succeeds."""
+        return True
+
+    def get_wait_time(self, tokens: int = 1) -> float:  # noqa: ARG002
+        """Get estimated wait time; always zero."""
+        return 0.0
+
+    @property
+    def is_limited(self) -> bool:
+        """Check if rate limiting is enabled; never."""
+        return False
+
+
 class AdaptiveRateLimiter(RateLimiter):
     """Adaptive rate limiter that adjusts based on server responses.
 
@@ -206,6 +374,16 @@ class AdaptiveRateLimiter(RateLimiter):
         >>> limiter.update_from_headers(response.headers)
     """
 
+    __slots__ = (
+        "_h_limit",
+        "_h_remaining",
+        "_h_reset",
+        "_header_config",
+        "_server_limit",
+        "_server_remaining",
+        "_server_reset",
+    )
+
     def __init__(
         self,
         config: RateLimiterConfig | None = None,
@@ -220,6 +398,13 @@ class AdaptiveRateLimiter(RateLimiter):
         super().__init__(config)
         self._header_config = header_config or {}
 
+        # Header names, resolved once rather than on every response
+        self._h_limit = self._header_config.get("requests_limit", "x-ratelimit-limit-requests")
+        self._h_remaining = self._header_config.get(
+            "requests_remaining", "x-ratelimit-remaining-requests"
+        )
+        self._h_reset = self._header_config.get("requests_reset")
+
         # Adaptive state
         self._server_limit: int | None = None
         self._server_remaining: int | None = None
@@ -232,40 +417,34 @@ class AdaptiveRateLimiter(RateLimiter):
             headers: Response headers
         """
         # Extract limit
-        limit_header = self._header_config.get("requests_limit", "x-ratelimit-limit-requests")
-        if limit_header in headers:
+        value = headers.get(self._h_limit)
+        if value is not None:
             try:
-                self._server_limit = int(headers[limit_header])
+                self._server_limit = int(value)
             except ValueError:
                 pass
 
         # Extract remaining
-        remaining_header = self._header_config.get(
-            "requests_remaining", "x-ratelimit-remaining-requests"
-        )
-        if remaining_header in headers:
+        value = headers.get(self._h_remaining)
+        if value is not None:
             try:
-                self._server_remaining = int(headers[remaining_header])
+                self._server_remaining = int(value)
                 # Update tokens to match server state
-                if self._server_remaining is not None:
-                    self._tokens = float(self._server_remaining)
+                self._tokens = self._server_remaining
             except ValueError:
                 pass
 
         # Extract reset time
-        reset_header = self._header_config.get("requests_reset")
-        if reset_header and reset_header in headers:
-            try:
-                # May be seconds or timestamp
-                reset_value = headers[reset_header]
-                if "s" in reset_value or "m" in reset_value:
-                    # Parse duration like "1s" or "1m"
-                    reset_value = reset_value.rstrip("sm")
-                    self._server_reset = float(reset_value)
-                else:
-                    self._server_reset = float(reset_value)
-            except ValueError:
-                pass
+        if self._h_reset:
+            value = headers.get(self._h_reset)
+            if value:
+                try:
+                    # May be seconds, a duration like "1s"/"1m", or a timestamp
+                    if value[-1] in "sm":
+                        value = value.rstrip("sm")
+                    self._server_reset = float(value)
+                except ValueError:
+                    pass
 
         # Adjust rate based on server limit
         if (
@@ -273,8 +452,18 @@ class AdaptiveRateLimiter(RateLimiter):
             and self._server_reset is not None
             and self._server_reset > 0
         ):
-            self._rate = self._server_limit / self._server_reset
-            self._max_tokens = float(self._server_limit)
+            self._set_rate(self._server_limit / self._server_reset)
+            self._max_tokens = self._server_limit
+
+        if self._tokens >= self._max_tokens:
+            # Server-reported or leftover tokens may exceed a shrunken bucket;
+            # like any full bucket, it carries no partial refill progress
+            self._tokens = self._max_tokens
+            self._last_refill_ns = time.monotonic_ns()
+
+        if self._waiters:
+            # The pending wake-up was timed for the old rate and tokens
+            self._reschedule()
 
     def get_server_state(self) -> dict[str, Any]:
         """Get current server-reported rate limit state.
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import asyncio
 import random
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
@@ -19,6 +19,9 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 
+# Bound method of the shared generator, so random.seed() still applies
+_random = random.random
+
 
 class JitterStrategy(str, Enum):
     """Jitter strategy for retry delays."""
@@ -28,7 +31,7 @@ class JitterStrategy(str, Enum):
     EQUAL = "equal"
 
 
-@dataclass
+@dataclass(slots=True)
 class RetryConfig:
     """Configuration for retry policy.
 
@@ -92,7 +95,7 @@ class RetryConfig:
         return cls(max_retries=0)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RetryResult:
     """Result of a retry operation.
 
@@ -111,12 +114,37 @@ class RetryResult:
     total_delay_ms: float = 0.0
 
 
+def _full_jitter(base_delay_ms: float) -> float:
+    """Random delay between 0 and the base delay, in seconds."""
+    return _random() * (base_delay_ms * 0.001)
+
+
+def _equal_jitter(base_delay_ms: float) -> float:
+    """Half the base delay plus a random share of the other half, in seconds."""
+    return (base_delay_ms * 0.0005) * (1.0 + _random())
+
+
+def _no_jitter(base_delay_ms: float) -> float:
+    """The base delay, in seconds."""
+    return base_delay_ms * 0.001
+
+
+_JITTER_FUNCS: dict[JitterStrategy, Callable[[float], float]] = {
+    JitterStrategy.FULL: _full_jitter,
+    JitterStrategy.EQUAL: _equal_jitter,
+    JitterStrategy.NONE: _no_jitter,
+}
+
+
 class RetryPolicy:
     """Retry policy with exponential backoff and jitter.
 
     Implements exponential backoff algorithm with configurable jitter
     to prevent thundering herd problems.
 
+    The config is copied at construction; later changes to the caller's
+    RetryConfig do not affect an existing policy.
+
     Example:
         >>> policy = RetryPolicy(RetryConfig(max_retries=3))
         >>> result = await policy.execute(async_operation)
@@ -130,9 +158,36 @@ class RetryPolicy:
         """Initialize retry policy.
 
         Args:
-            config: Retry configuration
+            config: Retry configuration (copied)
         """
-        self._config = config or RetryConfig()
+        # Private copy, so the tables below always match what is read live
+        self._config = replace(config) if config else RetryConfig()
+        # Capped backoff for every attempt the config allows, computed once
+        self._base_delays_ms = tuple(
+            self._base_delay_ms(attempt) for attempt in range(self._config.max_retries + 1)
+        )
+        # Frozen copies for membership tests on every failure
+        self._retry_on_status = frozenset(self._config.retry_on_status)
+        self._retry_on_error_class = frozenset(self._config.retry_on_error_class)
+        # Error type -> retry check for errors of that type
+        self._retry_checks: dict[type[Exception], Callable[[Exception], bool]] = {}
+        # Jitter function for the configured strategy; unknown values get none
+        try:
+            self._jitter_fn = _JITTER_FUNCS[JitterStrategy(self._config.jitter)]
+        except ValueError:
+            self._jitter_fn = _no_jitter
+
+    def _base_delay_ms(self, attempt: int) -> float:
+        """Compute the capped exponential delay for an attempt.
+
+        Args:
+            attempt: Attempt number (0-based)
+
+        Returns:
+            Delay in milliseconds before jitter
+        """
+        config = self._config
+        return min(config.min_delay_ms * (config.exponential_base**attempt), config.max_delay_ms)
 
     def calculate_delay(self, attempt: int, retry_after: float | None = None) -> float:
         """Calculate delay for a retry attempt.
@@ -148,24 +203,15 @@ class RetryPolicy:
         if retry_after is not None and retry_after > 0:
             return retry_after
 
-        # Calculate base exponential delay
-        base_delay_ms = self._config.min_delay_ms * (self._config.exponential_base**attempt)
-
-        # Cap at max delay
-        base_delay_ms = min(base_delay_ms, self._config.max_delay_ms)
-
-        # Apply jitter
-        if self._config.jitter == JitterStrategy.FULL:
-            # Full jitter: random between 0 and base_delay
-            delay_ms = random.uniform(0, base_delay_ms)
-        elif self._config.jitter == JitterStrategy.EQUAL:
-            # Equal jitter: base/2 + random(0, base/2)
-            delay_ms = base_delay_ms / 2 + random.uniform(0, base_delay_ms / 2)
+        # Capped exponential delay, from the table when in range
+        delays = self._base_delays_ms
+        if 0 <= attempt < len(delays):
+            base_delay_ms = delays[attempt]
         else:
-            # No jitter
-            delay_ms = base_delay_ms
+            base_delay_ms = self._base_delay_ms(attempt)
 
-        return delay_ms / 1000.0  # Convert to seconds
+        # Apply jitter and convert to seconds
+        return self._jitter_fn(base_delay_ms)
 
     def should_retry(self, error: Exception, attempt: int) -> bool:
         """Check if an error should trigger a retry.
@@ -181,25 +227,35 @@ class RetryPolicy:
         if attempt >= self._config.max_retries:
             return False
 
-        # Check if error is retryable
-        if isinstance(error, RemoteError):
-            # Check error class
-            if error.error_class in self._config.retry_on_error_class:
-                return True
-
-            # Check HTTP status
-            if error.status_code in self._config.retry_on_status:
-                return True
-
-            # Check explicit retryable flag
-            return error.retryable
-
-        # For other errors, check if retryable by class
-        if hasattr(error, "error_class"):
-            return is_retryable(error.error_class)
-
-        # Default: don't retry unknown errors
-        return False
+        error_type = type(error)
+        check = self._retry_checks.get(error_type)
+        if check is None:
+            check = (
+                self._should_retry_remote
+                if issubclass(error_type, RemoteError)
+                else self._should_retry_other
+            )
+            self._retry_checks[error_type] = check
+        return check(error)
+
+    def _should_retry_remote(self, error: Exception) -> bool:
+        """Check whether a RemoteError is retryable under this policy."""
+        remote = cast("RemoteError", error)
+        # Check error class, then HTTP status, then the explicit flag
+        if remote.error_class in self._retry_on_error_class:
+            return True
+        if remote.status_code in self._retry_on_status:
+            return True
+        return remote.retryable
+
+    @staticmethod
+    def _should_retry_other(error: Exception) -> bool:
+        """Check whether a non-remote error is retryable by its class."""
+        error_class = getattr(error, "error_class", None)
+        if error_class is None:
+            # Default: don't retry unknown errors
+            return False
+        return is_retryable(error_class)
 
     def get_retry_after(self, error: Exception) -> float | None:
         """Get retry-after hint from error.
@@ -228,9 +284,11 @@ class RetryPolicy:
         Returns:
             RetryResult with success status and value/error
         """
-        last_error: Exception | None = None
-        total_delay = 0.0
+        total_delay_ms = 0  # Whole milliseconds, the unit of RetryResult
         attempt = 0
+        # Resolved per call rather than per retry; still patchable in tests
+        sleep = asyncio.sleep
+        should_retry = self.should_retry
 
         while True:
             try:
@@ -239,39 +297,30 @@ class RetryPolicy:
                     success=True,
                     value=result,
                     attempts=attempt + 1,
-                    total_delay_ms=total_delay * 1000,
+                    total_delay_ms=float(total_delay_ms),
                 )
             except Exception as e:
-                last_error = e
                 attempt += 1
 
-                if not self.should_retry(e, attempt - 1):
+                if not should_retry(e, attempt - 1):
                     return RetryResult(
                         success=False,
                         error=e,
                         attempts=attempt,
-                        total_delay_ms=total_delay * 1000,
+                        total_delay_ms=float(total_delay_ms),
                     )
 
                 # Calculate delay
                 retry_after = self.get_retry_after(e)
                 delay = self.calculate_delay(attempt - 1, retry_after)
-                total_delay += delay
+                total_delay_ms += round(delay * 1000)
 
                 # Callback before retry
                 if on_retry:
                     on_retry(attempt, e, delay)
 
                 # Wait before retry
-                await asyncio.sleep(delay)
-
-        # Should never reach here
-        return RetryResult(
-            success=False,
-            error=last_error,
-            attempts=attempt,
-            total_delay_ms=total_delay * 1000,
-        )
+                await sleep(delay)
 
 
 async def with_retry(
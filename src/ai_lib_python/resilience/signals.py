@@ -6,15 +6,18 @@ Provides unified runtime state aggregation for orchestration decisions.
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from ai_lib_python.resilience.circuit_breaker import CircuitBreaker
     from ai_lib_python.resilience.rate_limiter import RateLimiter
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InflightSnapshot:
     """Snapshot of in-flight request state.
 
@@ -45,7 +48,7 @@ class InflightSnapshot:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RateLimiterSnapshot:
     """Snapshot of rate limiter state.
 
@@ -79,7 +82,7 @@ class RateLimiterSnapshot:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CircuitBreakerSnapshot:
     """Snapshot of circuit breaker state.
 
@@ -127,7 +130,7 @@ class CircuitBreakerSnapshot:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SignalsSnapshot:
     """Unified snapshot of all resilience signals.
 
@@ -147,7 +150,7 @@ class SignalsSnapshot:
     inflight: InflightSnapshot | None = None
     rate_limiter: RateLimiterSnapshot | None = None
     circuit_breaker: CircuitBreakerSnapshot | None = None
-    timestamp: float = field(default_factory=lambda: __import__("time").time())
+    timestamp: float = field(default_factory=time.time)
     provider: str | None = None
     model: str | None = None
 
@@ -173,32 +176,50 @@ class SignalsSnapshot:
 
         Higher is better. Considers all available signals.
         """
-        scores: list[float] = []
+        total = 0.0
+        count = 0
 
         # Circuit breaker contribution
-        if self.circuit_breaker:
-            if self.circuit_breaker.is_closed:
-                scores.append(1.0)
-            elif self.circuit_breaker.is_half_open:
-                scores.append(0.5)
-            else:
-                scores.append(0.0)
+        breaker = self.circuit_breaker
+        if breaker is not None:
+            count += 1
+            state = breaker.state
+            if state == "closed":
+                total += 1.0
+            elif state == "half_open":
+                total += 0.5
 
         # Rate limiter contribution
-        if self.rate_limiter:
-            if self.rate_limiter.is_throttled:
-                scores.append(0.0)
-            else:
-                scores.append(1.0 - self.rate_limiter.utilization)
+        limiter = self.rate_limiter
+        if limiter is not None:
+            count += 1
+            if not limiter.is_throttled:
+                total += 1.0 - limiter.utilization
 
         # In-flight contribution
-        if self.inflight:
-            scores.append(1.0 - self.inflight.utilization)
+        inflight = self.inflight
+        if inflight is not None:
+            count += 1
+            total += 1.0 - inflight.utilization
 
-        if not scores:
+        if not count:
             return 1.0
 
-        return sum(scores) / len(scores)
+        return total / count
+
+    @staticmethod
+    def score_batch(snapshots: Iterable[SignalsSnapshot]) -> list[float]:
+        """Calculate health scores for several snapshots at once.
+
+        Useful for ranking candidate providers or models in one call.
+
+        Args:
+            snapshots: Snapshots to score
+
+        Returns:
+            Health scores, in the same order as the snapshots
+        """
+        return [snapshot.health_score for snapshot in snapshots]
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -245,31 +266,24 @@ class SignalsSnapshot:
 
         rate_snap = None
         if rate_limiter:
+            # Read once: each access refills, and both fields must agree
+            tokens = rate_limiter.available_tokens
             rate_snap = RateLimiterSnapshot(
-                tokens_available=rate_limiter.available_tokens,
+                tokens_available=tokens,
                 max_tokens=float(rate_limiter._config.burst_size or 1),
                 refill_rate=rate_limiter._config.requests_per_second,
-                is_throttled=rate_limiter.available_tokens <= 0,
+                is_throttled=tokens <= 0,
             )
 
         breaker_snap = None
         if circuit_breaker:
-            import time
-
-            cooldown = None
-            if circuit_breaker.state.value == "open" and circuit_breaker._last_failure_time:
-                elapsed = time.monotonic() - circuit_breaker._last_failure_time
-                remaining = circuit_breaker._config.cooldown_seconds - elapsed
-                if remaining > 0:
-                    cooldown = remaining * 1000
-
             breaker_snap = CircuitBreakerSnapshot(
                 state=circuit_breaker.state.value,
-                failure_count=circuit_breaker._failure_count,
-                failure_threshold=circuit_breaker._config.failure_threshold,
-                success_count=circuit_breaker._success_count,
-                last_failure_time=circuit_breaker._last_failure_time,
-                cooldown_remaining_ms=cooldown,
+                failure_count=circuit_breaker.failure_count,
+                failure_threshold=circuit_breaker.failure_threshold,
+                success_count=circuit_breaker.success_count,
+                last_failure_time=circuit_breaker.last_failure_time,
+                cooldown_remaining_ms=circuit_breaker.cooldown_remaining_ms() or None,
             )
 
         return cls(
@@ -64,6 +64,7 @@ from ai_lib_python.routing.strategy import (
     ModelSelector,
     PerformanceBasedSelector,
     QualityBasedSelector,
+    RandomEndpointSelector,
     RandomSelector,
     RoundRobinEndpointSelector,
     RoundRobinSelector,
@@ -103,6 +104,7 @@ __all__ = [
     "PricingInfo",
     "QualityBasedSelector",
     "QualityTier",
+    "RandomEndpointSelector",
     "RandomSelector",
     "RoundRobinEndpointSelector",
     "RoundRobinSelector",
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from ai_lib_python.routing.strategy import (
     EndpointSelector,
@@ -28,6 +29,9 @@ from ai_lib_python.routing.types import (
     SpeedTier,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 class ModelManager:
     """Manager for model registration and selection.
@@ -46,6 +50,14 @@ class ModelManager:
         >>> recommended = manager.recommend_for("multimodal")
     """
 
+    __slots__ = (
+        "_models",
+        "_models_cache",
+        "_selector",
+        "_strategy",
+        "provider",
+    )
+
     def __init__(
         self,
         provider: str = "",
@@ -59,6 +71,8 @@ class ModelManager:
         """
         self.provider = provider
         self._models: dict[str, ModelInfo] = {}
+        # Snapshot for the selector and list_models; rebuilt after the models change
+        self._models_cache: tuple[ModelInfo, ...] | None = None
         self._strategy = strategy
         self._selector: ModelSelector = create_model_selector(strategy)
 
@@ -74,6 +88,7 @@ class ModelManager:
         if not model.provider and self.provider:
             model.provider = self.provider
         self._models[model.name] = model
+        self._models_cache = None
         return self
 
     def remove_model(self, model_name: str) -> ModelInfo | None:
@@ -85,7 +100,10 @@ class ModelManager:
         Returns:
             Removed model or None
         """
-        return self._models.pop(model_name, None)
+        model = self._models.pop(model_name, None)
+        if model is not None:
+            self._models_cache = None
+        return model
 
     def get_model(self, model_name: str) -> ModelInfo | None:
         """Get a model by name.
@@ -98,13 +116,20 @@ class ModelManager:
         """
         return self._models.get(model_name)
 
-    def list_models(self) -> list[ModelInfo]:
+    def list_models(self) -> tuple[ModelInfo, ...]:
         """List all registered models.
 
         Returns:
-            List of model info
+            Tuple of model info, shared until the registry changes
         """
-        return list(self._models.values())
+        return self._model_tuple()
+
+    def _model_tuple(self) -> tuple[ModelInfo, ...]:
+        """Get the cached tuple of registered models, rebuilding it if stale."""
+        models = self._models_cache
+        if models is None:
+            models = self._models_cache = tuple(self._models.values())
+        return models
 
     def with_strategy(self, strategy: ModelSelectionStrategy) -> ModelManager:
         """Set the selection strategy.
@@ -125,8 +150,7 @@ class ModelManager:
         Returns:
             Selected model or None
         """
-        models = list(self._models.values())
-        return self._selector.select(models)
+        return self._selector.select(self._model_tuple())
 
     def recommend_for(self, use_case: str) -> ModelInfo | None:
         """Recommend a model for a specific use case.
@@ -137,10 +161,9 @@ class ModelManager:
         Returns:
             Recommended model or None
         """
-        supported = [m for m in self._models.values() if m.supports(use_case)]
-        if not supported:
-            return None
-        return self._selector.select(supported)
+        return self._selector.select_filtered(
+            self._models.values(), ModelInfo.supports_filter(use_case)
+        )
 
     def filter_by_capability(self, capability: str) -> list[ModelInfo]:
         """Filter models by capability.
@@ -151,7 +174,7 @@ class ModelManager:
         Returns:
             List of models with the capability
         """
-        return [m for m in self._models.values() if m.supports(capability)]
+        return list(filter(ModelInfo.supports_filter(capability), self._models.values()))
 
     def filter_by_cost(self, max_cost_per_1k: float) -> list[ModelInfo]:
         """Filter models by maximum cost.
@@ -200,13 +223,20 @@ class ModelManager:
         content = path.read_text()
         models = json.loads(content)
 
-        if isinstance(models, list):
-            for model_data in models:
-                self.add_model(ModelInfo.from_dict(model_data))
-        elif isinstance(models, dict) and "models" in models:
-            for model_data in models["models"]:
-                self.add_model(ModelInfo.from_dict(model_data))
-
+        if isinstance(models, dict) and "models" in models:
+            models = models["models"]
+        elif not isinstance(models, list):
+            return self
+
+        # Register the whole catalog at once rather than via add_model
+        new_models = {m.name: m for m in map(ModelInfo.from_dict, models)}
+        provider = self.provider
+        if provider:
+            for model in new_models.values():
+                if not model.provider:
+                    model.provider = provider
+        self._models.update(new_models)
+        self._models_cache = None
         return self
 
     def save_to_config(self, config_path: str | Path) -> None:
@@ -246,6 +276,16 @@ class ModelArray:
         >>> endpoint = array.select_endpoint()
     """
 
+    __slots__ = (
+        "_by_name",
+        "_endpoints",
+        "_endpoints_snapshot",
+        "_selector",
+        "_strategy",
+        "health_check",
+        "name",
+    )
+
     def __init__(
         self,
         name: str,
@@ -261,6 +301,10 @@ class ModelArray:
         """
         self.name = name
         self._endpoints: list[ModelEndpoint] = []
+        # Read-only copy returned by the endpoints property
+        self._endpoints_snapshot: tuple[ModelEndpoint, ...] | None = None
+        # First endpoint registered under each name, for lookups by name
+        self._by_name: dict[str, ModelEndpoint] = {}
         self._strategy = strategy
         self._selector: EndpointSelector = create_endpoint_selector(strategy)
         self.health_check = health_check or HealthCheckConfig()
@@ -275,6 +319,8 @@ class ModelArray:
             Self for chaining
         """
         self._endpoints.append(endpoint)
+        self._by_name.setdefault(endpoint.name, endpoint)
+        self._endpoints_snapshot = None
         return self
 
     def remove_endpoint(self, endpoint_name: str) -> ModelEndpoint | None:
@@ -286,10 +332,17 @@ class ModelArray:
         Returns:
             Removed endpoint or None
         """
-        for i, endpoint in enumerate(self._endpoints):
-            if endpoint.name == endpoint_name:
-                return self._endpoints.pop(i)
-        return None
+        endpoint = self._by_name.pop(endpoint_name, None)
+        if endpoint is None:
+            return None
+        self._endpoints = [e for e in self._endpoints if e is not endpoint]
+        self._endpoints_snapshot = None
+        for other in self._endpoints:
+            if other.name == endpoint_name:
+                # A later endpoint shares the name; it becomes the one found
+                self._by_name[endpoint_name] = other
+                break
+        return endpoint
 
     def get_endpoint(self, endpoint_name: str) -> ModelEndpoint | None:
         """Get an endpoint by name.
@@ -300,10 +353,7 @@ class ModelArray:
         Returns:
             Endpoint or None
         """
-        for endpoint in self._endpoints:
-            if endpoint.name == endpoint_name:
-                return endpoint
-        return None
+        return self._by_name.get(endpoint_name)
 
     def with_strategy(self, strategy: LoadBalancingStrategy) -> ModelArray:
         """Set the load balancing strategy.
@@ -373,9 +423,12 @@ class ModelArray:
         return [e for e in self._endpoints if e.healthy]
 
     @property
-    def endpoints(self) -> list[ModelEndpoint]:
-        """Get all endpoints."""
-        return list(self._endpoints)
+    def endpoints(self) -> tuple[ModelEndpoint, ...]:
+        """Get all endpoints, as a tuple shared until the array changes."""
+        snapshot = self._endpoints_snapshot
+        if snapshot is None:
+            snapshot = self._endpoints_snapshot = tuple(self._endpoints)
+        return snapshot
 
     @property
     def strategy(self) -> LoadBalancingStrategy:
@@ -562,6 +615,12 @@ def create_anthropic_models() -> ModelManager:
 # Global model registry
 _global_managers: dict[str, ModelManager] = {}
 
+# Built-in catalogs, constructed only when a provider is first requested
+_CATALOG_FACTORIES: dict[str, Callable[[], ModelManager]] = {
+    "openai": create_openai_models,
+    "anthropic": create_anthropic_models,
+}
+
 
 def get_model_manager(provider: str) -> ModelManager:
     """Get or create a model manager for a provider.
@@ -572,14 +631,13 @@ def get_model_manager(provider: str) -> ModelManager:
     Returns:
         ModelManager instance
     """
-    if provider not in _global_managers:
-        if provider == "openai":
-            _global_managers[provider] = create_openai_models()
-        elif provider == "anthropic":
-            _global_managers[provider] = create_anthropic_models()
-        else:
-            _global_managers[provider] = ModelManager(provider=provider)
-    return _global_managers[provider]
+    manager = _global_managers.get(provider)
+    if manager is None:
+        factory = _CATALOG_FACTORIES.get(provider)
+        manager = factory() if factory else ModelManager(provider=provider)
+        # setdefault keeps the first manager if another thread got here first
+        manager = _global_managers.setdefault(provider, manager)
+    return manager
 
 
 def register_model_manager(provider: str, manager: ModelManager) -> None:
@@ -6,14 +6,54 @@ Provides various strategies for selecting models and distributing load.
 
 from __future__ import annotations
 
+import itertools
 import random
+import threading
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import TYPE_CHECKING
 
+from ai_lib_python.routing.types import QualityTier, SpeedTier
+
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
     from ai_lib_python.routing.types import ModelEndpoint, ModelInfo
 
+_random = random.random
+
+# Tier scores used by the score-based selectors (unknown tiers score 2)
+_SPEED_SCORE: dict[SpeedTier, int] = {
+    SpeedTier.FAST: 3,
+    SpeedTier.BALANCED: 2,
+    SpeedTier.SLOW: 1,
+}
+_QUALITY_SCORE: dict[QualityTier, int] = {
+    QualityTier.EXCELLENT: 3,
+    QualityTier.GOOD: 2,
+    QualityTier.BASIC: 1,
+}
+
+
+def _speed_score(model: ModelInfo) -> int:
+    return _SPEED_SCORE.get(model.performance.speed, 2)
+
+
+def _quality_score(model: ModelInfo) -> int:
+    return _QUALITY_SCORE.get(model.performance.quality, 2)
+
+
+def _combined_score(model: ModelInfo) -> int:
+    performance = model.performance
+    return _SPEED_SCORE.get(performance.speed, 2) + _QUALITY_SCORE.get(performance.quality, 2)
+
+
+def _cost(model: ModelInfo) -> float:
+    pricing = model.pricing
+    if pricing is None:
+        return float("inf")
+    return pricing.input_cost_per_1k + pricing.output_cost_per_1k
+
 
 class ModelSelectionStrategy(str, Enum):
     """Model selection strategy types."""
@@ -40,8 +80,10 @@ class LoadBalancingStrategy(str, Enum):
 class ModelSelector(ABC):
     """Abstract base class for model selection."""
 
+    __slots__ = ()
+
     @abstractmethod
-    def select(self, models: list[ModelInfo]) -> ModelInfo | None:
+    def select(self, models: Sequence[ModelInfo]) -> ModelInfo | None:
         """Select a model from the list.
 
         Args:
@@ -52,24 +94,79 @@ class ModelSelector(ABC):
         """
         raise NotImplementedError
 
+    def select_filtered(
+        self, models: Iterable[ModelInfo], predicate: Callable[[ModelInfo], bool]
+    ) -> ModelInfo | None:
+        """Select a model from those matching a predicate.
 
-class RoundRobinSelector(ModelSelector):
-    """Round-robin model selector.
+        Score-based selectors override this to filter and select in a
+        single pass; the default collects the matches and calls
+        :meth:`select`.
+
+        Args:
+            models: Candidate models
+            predicate: Returns True for models eligible for selection
+
+        Returns:
+            Selected model or None
+        """
+        return self.select([m for m in models if predicate(m)])
+
+
+class _Rotation:
+    """Per-thread round-robin position shared by the round-robin selectors.
 
-    Cycles through models in order.
+    Each thread keeps its own position, so concurrent threads never
+    contend on a shared counter; thread N starts its rotation at item N
+    to spread cold starts. Copies and pickles carry only the next start
+    offset and rebuild the thread-local state.
     """
 
+    __slots__ = ("_local", "_starts")
+
     def __init__(self) -> None:
-        """Initialize selector."""
-        self._index = 0
+        """Initialize rotation state."""
+        self._local = threading.local()
+        self._starts = itertools.count()
+
+    def _next_index(self) -> int:
+        """Get this thread's next rotation index."""
+        local = self._local
+        index: int
+        try:
+            index = local.index
+        except AttributeError:
+            index = next(self._starts)
+        local.index = index + 1
+        return index
+
+    def __getstate__(self) -> int:
+        """Get the next start offset as the copy/pickle state."""
+        # threading.local and itertools.count cannot be copied or pickled;
+        # taking the offset only skips one unused start
+        return next(self._starts)
+
+    def __setstate__(self, state: int) -> None:
+        """Rebuild rotation state starting at the saved offset."""
+        self._local = threading.local()
+        self._starts = itertools.count(state)
+
+
+class RoundRobinSelector(_Rotation, ModelSelector):
+    """Round-robin model selector.
+
+    Cycles through models in order. Each thread keeps its own position,
+    so concurrent threads never contend on a shared counter; thread N
+    starts its rotation at model N to spread cold starts.
+    """
+
+    __slots__ = ()
 
-    def select(self, models: list[ModelInfo]) -> ModelInfo | None:
+    def select(self, models: Sequence[ModelInfo]) -> ModelInfo | None:
         """Select next model in rotation."""
         if not models:
             return None
-        model = models[self._index % len(models)]
-        self._index += 1
-        return model
+        return models[self._next_index() % len(models)]
 
 
 class WeightedSelector(ModelSelector):
@@ -78,29 +175,17 @@ class WeightedSelector(ModelSelector):
     Selects models based on combined speed and quality scores.
     """
 
-    def select(self, models: list[ModelInfo]) -> ModelInfo | None:
-        """Select model with highest combined score."""
-        if not models:
-            return None
-
-        def score(model: ModelInfo) -> int:
-            from ai_lib_python.routing.types import QualityTier, SpeedTier
-
-            speed_score = {
-                SpeedTier.FAST: 3,
-                SpeedTier.BALANCED: 2,
-                SpeedTier.SLOW: 1,
-            }.get(model.performance.speed, 2)
+    __slots__ = ()
 
-            quality_score = {
-                QualityTier.EXCELLENT: 3,
-                QualityTier.GOOD: 2,
-                QualityTier.BASIC: 1,
-            }.get(model.performance.quality, 2)
-
-            return speed_score + quality_score
+    def select(self, models: Sequence[ModelInfo]) -> ModelInfo | None:
+        """Select model with highest combined score."""
+        return max(models, key=_combined_score, default=None)
 
-        return max(models, key=score)
+    def select_filtered(
+        self, models: Iterable[ModelInfo], predicate: Callable[[ModelInfo], bool]
+    ) -> ModelInfo | None:
+        """Select highest scoring model among those matching ``predicate``."""
+        return max(filter(predicate, models), key=_combined_score, default=None)
 
 
 class LeastConnectionsSelector(ModelSelector):
@@ -111,26 +196,25 @@ class LeastConnectionsSelector(ModelSelector):
     would need integration with the transport layer.
     """
 
+    __slots__ = ("_connections",)
+
     def __init__(self) -> None:
         """Initialize selector."""
         self._connections: dict[str, int] = {}
 
-    def select(self, models: list[ModelInfo]) -> ModelInfo | None:
+    def select(self, models: Sequence[ModelInfo]) -> ModelInfo | None:
         """Select model with fewest connections."""
         if not models:
             return None
 
-        # Find model with minimum connections
-        min_connections = float("inf")
-        selected = models[0]
+        connections = self._connections
+        if not connections:
+            # Nothing in flight: every model ties at zero
+            return models[0]
 
-        for model in models:
-            count = self._connections.get(model.name, 0)
-            if count < min_connections:
-                min_connections = count
-                selected = model
-
-        return selected
+        # First model with the fewest connections
+        get = connections.get
+        return min(models, key=lambda model: get(model.name, 0))
 
     def increment(self, model_name: str) -> None:
         """Increment connection count for a model."""
@@ -139,7 +223,11 @@ class LeastConnectionsSelector(ModelSelector):
     def decrement(self, model_name: str) -> None:
         """Decrement connection count for a model."""
         count = self._connections.get(model_name, 0)
-        self._connections[model_name] = max(0, count - 1)
+        if count > 1:
+            self._connections[model_name] = count - 1
+        else:
+            # Idle models are dropped so the map only holds busy ones
+            self._connections.pop(model_name, None)
 
 
 class PerformanceBasedSelector(ModelSelector):
@@ -148,21 +236,17 @@ class PerformanceBasedSelector(ModelSelector):
     Selects the fastest model.
     """
 
-    def select(self, models: list[ModelInfo]) -> ModelInfo | None:
-        """Select fastest model."""
-        if not models:
-            return None
-
-        from ai_lib_python.routing.types import SpeedTier
+    __slots__ = ()
 
-        def speed_score(model: ModelInfo) -> int:
-            return {
-                SpeedTier.FAST: 3,
-                SpeedTier.BALANCED: 2,
-                SpeedTier.SLOW: 1,
-            }.get(model.performance.speed, 2)
+    def select(self, models: Sequence[ModelInfo]) -> ModelInfo | None:
+        """Select fastest model."""
+        return max(models, key=_speed_score, default=None)
 
-        return max(models, key=speed_score)
+    def select_filtered(
+        self, models: Iterable[ModelInfo], predicate: Callable[[ModelInfo], bool]
+    ) -> ModelInfo | None:
+        """Select fastest model among those matching ``predicate``."""
+        return max(filter(predicate, models), key=_speed_score, default=None)
 
 
 class CostBasedSelector(ModelSelector):
@@ -171,17 +255,17 @@ class CostBasedSelector(ModelSelector):
     Selects the cheapest model.
     """
 
-    def select(self, models: list[ModelInfo]) -> ModelInfo | None:
-        """Select cheapest model."""
-        if not models:
-            return None
+    __slots__ = ()
 
-        def cost(model: ModelInfo) -> float:
-            if model.pricing is None:
-                return float("inf")
-            return model.pricing.input_cost_per_1k + model.pricing.output_cost_per_1k
+    def select(self, models: Sequence[ModelInfo]) -> ModelInfo | None:
+        """Select cheapest model."""
+        return min(models, key=_cost, default=None)
 
-        return min(models, key=cost)
+    def select_filtered(
+        self, models: Iterable[ModelInfo], predicate: Callable[[ModelInfo], bool]
+    ) -> ModelInfo | None:
+        """Select cheapest model among those matching ``predicate``."""
+        return min(filter(predicate, models), key=_cost, default=None)
 
 
 class QualityBasedSelector(ModelSelector):
@@ -190,27 +274,25 @@ class QualityBasedSelector(ModelSelector):
     Selects the highest quality model.
     """
 
-    def select(self, models: list[ModelInfo]) -> ModelInfo | None:
-        """Select highest quality model."""
-        if not models:
-            return None
+    __slots__ = ()
 
-        from ai_lib_python.routing.types import QualityTier
-
-        def quality_score(model: ModelInfo) -> int:
-            return {
-                QualityTier.EXCELLENT: 3,
-                QualityTier.GOOD: 2,
-                QualityTier.BASIC: 1,
-            }.get(model.performance.quality, 2)
+    def select(self, models: Sequence[ModelInfo]) -> ModelInfo | None:
+        """Select highest quality model."""
+        return max(models, key=_quality_score, default=None)
 
-        return max(models, key=quality_score)
+    def select_filtered(
+        self, models: Iterable[ModelInfo], predicate: Callable[[ModelInfo], bool]
+    ) -> ModelInfo | None:
+        """Select highest quality model among those matching ``predicate``."""
+        return max(filter(predicate, models), key=_quality_score, default=None)
 
 
 class RandomSelector(ModelSelector):
     """Random model selector."""
 
-    def select(self, models: list[ModelInfo]) -> ModelInfo | None:
+    __slots__ = ()
+
+    def select(self, models: Sequence[ModelInfo]) -> ModelInfo | None:
         """Select random model."""
         if not models:
             return None
@@ -220,6 +302,8 @@ class RandomSelector(ModelSelector):
 class EndpointSelector(ABC):
     """Abstract base class for endpoint selection."""
 
+    __slots__ = ()
+
     @abstractmethod
     def select(self, endpoints: list[ModelEndpoint]) -> ModelEndpoint | None:
         """Select an endpoint from the list.
@@ -233,53 +317,100 @@ class EndpointSelector(ABC):
         raise NotImplementedError
 
 
-class RoundRobinEndpointSelector(EndpointSelector):
-    """Round-robin endpoint selector."""
+class RoundRobinEndpointSelector(_Rotation, EndpointSelector):
+    """Round-robin endpoint selector.
 
-    def __init__(self) -> None:
-        """Initialize selector."""
-        self._index = 0
+    Keeps a rotation position per thread, like :class:`RoundRobinSelector`.
+    """
+
+    __slots__ = ()
 
     def select(self, endpoints: list[ModelEndpoint]) -> ModelEndpoint | None:
         """Select next healthy endpoint in rotation."""
         healthy = [e for e in endpoints if e.healthy]
         if not healthy:
             return None
-        endpoint = healthy[self._index % len(healthy)]
-        self._index += 1
-        return endpoint
+        return healthy[self._next_index() % len(healthy)]
+
+
+def _build_alias_table(weights: list[float]) -> tuple[list[float], list[int]]:
+    """Build a Vose alias table for O(1) weighted sampling.
+
+    Args:
+        weights: Non-negative weights with a positive sum
+
+    Returns:
+        Tuple of (probabilities, aliases), one entry per weight
+    """
+    n = len(weights)
+    total = sum(weights)
+    scaled = [w * n / total for w in weights]
+    prob = [1.0] * n
+    alias = list(range(n))
+
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        lo = small.pop()
+        hi = large.pop()
+        prob[lo] = scaled[lo]
+        alias[lo] = hi
+        scaled[hi] += scaled[lo] - 1.0
+        (small if scaled[hi] < 1.0 else large).append(hi)
+
+    # Leftovers are 1.0 up to rounding error
+    return prob, alias
 
 
 class WeightedEndpointSelector(EndpointSelector):
     """Weighted endpoint selector.
 
-    Selects endpoints based on their weights.
+    Selects endpoints based on their weights, using an alias table that
+    is rebuilt only when the healthy endpoints or their weights change.
     """
 
+    __slots__ = (
+        "_alias",
+        "_prob",
+        "_table_endpoints",
+        "_table_weights",
+    )
+
+    def __init__(self) -> None:
+        """Initialize selector."""
+        self._table_endpoints: list[ModelEndpoint] = []
+        self._table_weights: list[float] = []
+        self._prob: list[float] = []
+        self._alias: list[int] = []
+
     def select(self, endpoints: list[ModelEndpoint]) -> ModelEndpoint | None:
         """Select endpoint based on weight distribution."""
         healthy = [e for e in endpoints if e.healthy]
         if not healthy:
             return None
 
-        total_weight = sum(e.weight for e in healthy)
-        if total_weight <= 0:
-            return healthy[0]
-
-        # Weighted random selection
-        r = random.uniform(0, total_weight)
-        cumulative = 0.0
-        for endpoint in healthy:
-            cumulative += endpoint.weight
-            if r <= cumulative:
-                return endpoint
+        weights = [max(e.weight, 0.0) for e in healthy]
+        if weights != self._table_weights or healthy != self._table_endpoints:
+            if sum(weights) <= 0:
+                return healthy[0]
+            self._prob, self._alias = _build_alias_table(weights)
+            self._table_endpoints = healthy
+            self._table_weights = weights
 
-        return healthy[-1]
+        # Weighted random selection from one draw: the integer part picks a
+        # column, the fractional part decides between it and its alias
+        u = _random() * len(healthy)
+        i = int(u)
+        if u - i < self._prob[i]:
+            return healthy[i]
+        return healthy[self._alias[i]]
 
 
 class LeastConnectionsEndpointSelector(EndpointSelector):
     """Least connections endpoint selector."""
 
+    __slots__ = ()
+
     def select(self, endpoints: list[ModelEndpoint]) -> ModelEndpoint | None:
         """Select healthy endpoint with fewest connections."""
         healthy = [e for e in endpoints if e.healthy]
@@ -294,6 +425,8 @@ class HealthBasedEndpointSelector(EndpointSelector):
     Prioritizes healthy endpoints.
     """
 
+    __slots__ = ()
+
     def select(self, endpoints: list[ModelEndpoint]) -> ModelEndpoint | None:
         """Select first healthy endpoint."""
         for endpoint in endpoints:
@@ -302,6 +435,41 @@ class HealthBasedEndpointSelector(EndpointSelector):
         return None
 
 
+class RandomEndpointSelector(EndpointSelector):
+    """Random endpoint selector.
+
+    Picks uniformly among endpoints, ignoring their weights.
+    """
+
+    __slots__ = ()
+
+    def select(self, endpoints: list[ModelEndpoint]) -> ModelEndpoint | None:
+        """Select random healthy endpoint."""
+        healthy = [e for e in endpoints if e.healthy]
+        if not healthy:
+            return None
+        return random.choice(healthy)
+
+
+_MODEL_SELECTORS: dict[ModelSelectionStrategy, type[ModelSelector]] = {
+    ModelSelectionStrategy.ROUND_ROBIN: RoundRobinSelector,
+    ModelSelectionStrategy.WEIGHTED: WeightedSelector,
+    ModelSelectionStrategy.LEAST_CONNECTIONS: LeastConnectionsSelector,
+    ModelSelectionStrategy.PERFORMANCE_BASED: PerformanceBasedSelector,
+    ModelSelectionStrategy.COST_BASED: CostBasedSelector,
+    ModelSelectionStrategy.QUALITY_BASED: QualityBasedSelector,
+    ModelSelectionStrategy.RANDOM: RandomSelector,
+}
+
+_ENDPOINT_SELECTORS: dict[LoadBalancingStrategy, type[EndpointSelector]] = {
+    LoadBalancingStrategy.ROUND_ROBIN: RoundRobinEndpointSelector,
+    LoadBalancingStrategy.WEIGHTED: WeightedEndpointSelector,
+    LoadBalancingStrategy.LEAST_CONNECTIONS: LeastConnectionsEndpointSelector,
+    LoadBalancingStrategy.HEALTH_BASED: HealthBasedEndpointSelector,
+    LoadBalancingStrategy.RANDOM: RandomEndpointSelector,
+}
+
+
 def create_model_selector(strategy: ModelSelectionStrategy) -> ModelSelector:
     """Create a model selector for the given strategy.
 
@@ -311,16 +479,7 @@ def create_model_selector(strategy: ModelSelectionStrategy) -> ModelSelector:
     Returns:
         ModelSelector instance
     """
-    selectors: dict[ModelSelectionStrategy, type[ModelSelector]] = {
-        ModelSelectionStrategy.ROUND_ROBIN: RoundRobinSelector,
-        ModelSelectionStrategy.WEIGHTED: WeightedSelector,
-        ModelSelectionStrategy.LEAST_CONNECTIONS: LeastConnectionsSelector,
-        ModelSelectionStrategy.PERFORMANCE_BASED: PerformanceBasedSelector,
-        ModelSelectionStrategy.COST_BASED: CostBasedSelector,
-        ModelSelectionStrategy.QUALITY_BASED: QualityBasedSelector,
-        ModelSelectionStrategy.RANDOM: RandomSelector,
-    }
-    return selectors.get(strategy, RoundRobinSelector)()
+    return _MODEL_SELECTORS.get(strategy, RoundRobinSelector)()
 
 
 def create_endpoint_selector(strategy: LoadBalancingStrategy) -> EndpointSelector:
@@ -332,14 +491,4 @@ def create_endpoint_selector(strategy: LoadBalancingStrategy) -> EndpointSelecto
     Returns:
         EndpointSelector instance
     """
-    selectors: dict[LoadBalancingStrategy, type[EndpointSelector]] = {
-        LoadBalancingStrategy.ROUND_ROBIN: RoundRobinEndpointSelector,
-        LoadBalancingStrategy.WEIGHTED: WeightedEndpointSelector,
-        LoadBalancingStrategy.LEAST_CONNECTIONS: LeastConnectionsEndpointSelector,
-        LoadBalancingStrategy.HEALTH_BASED: HealthBasedEndpointSelector,
-        LoadBalancingStrategy.RANDOM: lambda: WeightedEndpointSelector(),  # type: ignore
-    }
-    selector_class = selectors.get(strategy, RoundRobinEndpointSelector)
-    if callable(selector_class):
-        return selector_class()
-    return selector_class()
+    return _ENDPOINT_SELECTORS.get(strategy, RoundRobinEndpointSelector)()
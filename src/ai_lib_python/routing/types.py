@@ -8,7 +8,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from operator import attrgetter
+from sys import intern
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 
 class SpeedTier(str, Enum):
@@ -27,7 +32,35 @@ class QualityTier(str, Enum):
     EXCELLENT = "excellent"
 
 
-@dataclass
+# Value -> member lookups; a dict hit skips the Enum call machinery
+_SPEED_BY_VALUE: dict[str, SpeedTier] = {m.value: m for m in SpeedTier}
+_QUALITY_BY_VALUE: dict[str, QualityTier] = {m.value: m for m in QualityTier}
+
+# Capability names and aliases -> flags on ModelCapabilities (any one set is enough)
+_CAPABILITY_FIELDS: dict[str, tuple[str, ...]] = {
+    "chat": ("chat",),
+    "code_generation": ("code_generation",),
+    "code": ("code_generation",),
+    "multimodal": ("multimodal",),
+    "vision": ("multimodal",),
+    "function_calling": ("function_calling",),
+    "functions": ("function_calling",),
+    "tool_use": ("tool_use",),
+    "tools": ("tool_use", "function_calling"),
+    "multilingual": ("multilingual",),
+    "embedding": ("embedding",),
+    "embeddings": ("embedding",),
+    "streaming": ("streaming",),
+    "stream": ("streaming",),
+}
+
+
+def _intern(value: Any) -> Any:
+    """Intern a config identifier; sys.intern only accepts exact str."""
+    return intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class ModelCapabilities:
     """Model capabilities definition.
 
@@ -62,23 +95,13 @@ class ModelCapabilities:
         Returns:
             True if supported
         """
-        capability_map = {
-            "chat": self.chat,
-            "code_generation": self.code_generation,
-            "code": self.code_generation,
-            "multimodal": self.multimodal,
-            "vision": self.multimodal,
-            "function_calling": self.function_calling,
-            "functions": self.function_calling,
-            "tool_use": self.tool_use,
-            "tools": self.tool_use or self.function_calling,
-            "multilingual": self.multilingual,
-            "embedding": self.embedding,
-            "embeddings": self.embedding,
-            "streaming": self.streaming,
-            "stream": self.streaming,
-        }
-        return capability_map.get(capability.lower(), False)
+        # Table keys are lowercase, so most names match without lower()
+        fields = _CAPABILITY_FIELDS.get(capability) or _CAPABILITY_FIELDS.get(capability.lower())
+        if fields is None:
+            return False
+        if len(fields) == 1:
+            return bool(getattr(self, fields[0]))
+        return any(getattr(self, name) for name in fields)
 
     def with_chat(self) -> ModelCapabilities:
         """Enable chat capability."""
@@ -127,20 +150,21 @@ class ModelCapabilities:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ModelCapabilities:
         """Create from dictionary."""
+        get = data.get
         return cls(
-            chat=data.get("chat", True),
-            code_generation=data.get("code_generation", False),
-            multimodal=data.get("multimodal", False),
-            function_calling=data.get("function_calling", False),
-            tool_use=data.get("tool_use", False),
-            multilingual=data.get("multilingual", False),
-            context_window=data.get("context_window"),
-            embedding=data.get("embedding", False),
-            streaming=data.get("streaming", True),
+            chat=get("chat", True),
+            code_generation=get("code_generation", False),
+            multimodal=get("multimodal", False),
+            function_calling=get("function_calling", False),
+            tool_use=get("tool_use", False),
+            multilingual=get("multilingual", False),
+            context_window=get("context_window"),
+            embedding=get("embedding", False),
+            streaming=get("streaming", True),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PricingInfo:
     """Pricing information for a model.
 
@@ -164,9 +188,11 @@ class PricingInfo:
         Returns:
             Total cost
         """
-        input_cost = (input_tokens / 1000.0) * self.input_cost_per_1k
-        output_cost = (output_tokens / 1000.0) * self.output_cost_per_1k
-        return input_cost + output_cost
+        # Scale once at the end: one division instead of two, and no inexact
+        # 0.001 factor baked into every term
+        return (
+            input_tokens * self.input_cost_per_1k + output_tokens * self.output_cost_per_1k
+        ) / 1000.0
 
     def with_currency(self, currency: str) -> PricingInfo:
         """Set currency."""
@@ -191,7 +217,7 @@ class PricingInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetrics:
     """Performance metrics for a model.
 
@@ -239,16 +265,42 @@ class PerformanceMetrics:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> PerformanceMetrics:
         """Create from dictionary."""
+        get = data.get
+        speed = get("speed", "balanced")
+        quality = get("quality", "good")
+        # Unknown values fall through to the constructor so they still raise
         return cls(
-            speed=SpeedTier(data.get("speed", "balanced")),
-            quality=QualityTier(data.get("quality", "good")),
-            avg_response_time_ms=data.get("avg_response_time_ms"),
-            throughput_tps=data.get("throughput_tps"),
+            speed=_SPEED_BY_VALUE.get(speed) or SpeedTier(speed),
+            quality=_QUALITY_BY_VALUE.get(quality) or QualityTier(quality),
+            avg_response_time_ms=get("avg_response_time_ms"),
+            throughput_tps=get("throughput_tps"),
         )
 
 
-@dataclass
-class ModelInfo:
+class _FullIdCache:
+    """Caches ModelInfo.full_id in a slot outside its dataclass fields."""
+
+    __slots__ = ("_full_id",)
+
+    # (provider, name, full_id) from the last full_id access; unset until then
+    _full_id: tuple[str, str, str]
+
+    def _cached_full_id(self, provider: str, name: str) -> str:
+        """Join provider and name, reusing the last string while both are unchanged."""
+        try:
+            cached = self._full_id
+        except AttributeError:
+            pass
+        else:
+            if cached[0] is provider and cached[1] is name:
+                return cached[2]
+        full_id = f"{provider}/{name}" if provider else name
+        self._full_id = (provider, name, full_id)
+        return full_id
+
+
+@dataclass(slots=True)
+class ModelInfo(_FullIdCache):
     """Complete model information.
 
     Attributes:
@@ -278,15 +330,39 @@ class ModelInfo:
 
     @property
     def full_id(self) -> str:
-        """Get full model identifier (provider/name)."""
-        if self.provider:
-            return f"{self.provider}/{self.name}"
-        return self.name
+        """Get full model identifier (provider/name).
+
+        The string is cached and reused until ``provider`` or ``name`` is
+        reassigned (the manager fills in ``provider`` after construction),
+        so repeated dict lookups keep its precomputed hash.
+        """
+        return self._cached_full_id(self.provider, self.name)
 
     def supports(self, capability: str) -> bool:
         """Check if model supports a capability."""
         return self.capabilities.supports(capability)
 
+    @staticmethod
+    def supports_filter(capability: str) -> Callable[[ModelInfo], bool]:
+        """Build a predicate equivalent to ``model.supports(capability)``.
+
+        The capability name is resolved once, so filtering many models
+        costs one C-level attribute lookup per model.
+
+        Args:
+            capability: Capability name
+
+        Returns:
+            Predicate taking a model
+        """
+        fields = _CAPABILITY_FIELDS.get(capability.lower())
+        if fields is None:
+            return lambda _model: False
+        if len(fields) == 1:
+            return attrgetter(f"capabilities.{fields[0]}")
+        getters = [attrgetter(f"capabilities.{name}") for name in fields]
+        return lambda model: any(getter(model) for getter in getters)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -303,19 +379,22 @@ class ModelInfo:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ModelInfo:
         """Create from dictionary."""
+        get = data.get
+        pricing = get("pricing")
+        # Identifiers repeat across a catalog and key routing dicts; intern them
         return cls(
-            name=data["name"],
-            display_name=data.get("display_name", ""),
-            description=data.get("description", ""),
-            provider=data.get("provider", ""),
-            capabilities=ModelCapabilities.from_dict(data.get("capabilities", {})),
-            pricing=(PricingInfo.from_dict(data["pricing"]) if data.get("pricing") else None),
-            performance=PerformanceMetrics.from_dict(data.get("performance", {})),
-            metadata=data.get("metadata", {}),
+            name=_intern(data["name"]),
+            display_name=get("display_name", ""),
+            description=get("description", ""),
+            provider=_intern(get("provider", "")),
+            capabilities=ModelCapabilities.from_dict(get("capabilities", {})),
+            pricing=PricingInfo.from_dict(pricing) if pricing else None,
+            performance=PerformanceMetrics.from_dict(get("performance", {})),
+            metadata=get("metadata", {}),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelEndpoint:
     """Model endpoint for load balancing.
 
@@ -349,17 +428,18 @@ class ModelEndpoint:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ModelEndpoint:
         """Create from dictionary."""
+        get = data.get
         return cls(
-            name=data["name"],
-            model_name=data["model_name"],
+            name=_intern(data["name"]),
+            model_name=_intern(data["model_name"]),
             url=data["url"],
-            weight=data.get("weight", 1.0),
-            healthy=data.get("healthy", True),
-            connection_count=data.get("connection_count", 0),
+            weight=get("weight", 1.0),
+            healthy=get("healthy", True),
+            connection_count=get("connection_count", 0),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthCheckConfig:
     """Health check configuration for endpoints.
 
@@ -387,9 +467,10 @@ class HealthCheckConfig:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> HealthCheckConfig:
         """Create from dictionary."""
+        get = data.get
         return cls(
-            endpoint=data.get("endpoint", "/health"),
-            interval_seconds=data.get("interval_seconds", 30.0),
-            timeout_seconds=data.get("timeout_seconds", 5.0),
-            max_failures=data.get("max_failures", 3),
+            endpoint=get("endpoint", "/health"),
+            interval_seconds=get("interval_seconds", 30.0),
+            timeout_seconds=get("timeout_seconds", 5.0),
+            max_failures=get("max_failures", 3),
         )
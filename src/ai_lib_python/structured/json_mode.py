@@ -7,6 +7,7 @@ Provides configuration and utilities for JSON mode responses.
 from __future__ import annotations
 
 import json
+import re
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, TypeVar
@@ -18,6 +19,14 @@ from ai_lib_python.structured.validator import OutputValidator, ValidationResult
 
 T = TypeVar("T", bound=BaseModel)
 
+# Where extract_json looks for JSON, in order of preference
+_EXTRACT_PATTERNS = (
+    re.compile(r"```json\s*([\s\S]*?)\s*```"),  # ```json ... ```
+    re.compile(r"```\s*([\s\S]*?)\s*```"),  # ``` ... ```
+    re.compile(r"\{[\s\S]*\}"),  # Raw JSON object
+    re.compile(r"\[[\s\S]*\]"),  # Raw JSON array
+)
+
 
 class JsonMode(str, Enum):
     """JSON mode options."""
@@ -32,7 +41,7 @@ class JsonMode(str, Enum):
     OFF = "off"
 
 
-@dataclass
+@dataclass(slots=True)
 class JsonModeConfig:
     """Configuration for JSON mode.
 
@@ -146,7 +155,7 @@ class JsonModeConfig:
         return {}
 
 
-@dataclass
+@dataclass(slots=True)
 class StructuredOutput:
     """Structured output result with validation.
 
@@ -253,8 +262,6 @@ def extract_json(text: str) -> dict[str, Any] | None:
         >>> extract_json(text)
         {'name': 'Alice'}
     """
-    import re
-
     # Try direct parsing first
     try:
         parsed = json.loads(text)
@@ -264,15 +271,8 @@ def extract_json(text: str) -> dict[str, Any] | None:
         pass
 
     # Try to extract from markdown code blocks
-    patterns = [
-        r"```json\s*([\s\S]*?)\s*```",  # ```json ... ```
-        r"```\s*([\s\S]*?)\s*```",  # ``` ... ```
-        r"\{[\s\S]*\}",  # Raw JSON object
-        r"\[[\s\S]*\]",  # Raw JSON array
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text)
+    for pattern in _EXTRACT_PATTERNS:
+        match = pattern.search(text)
         if match:
             try:
                 candidate = match.group(1) if match.lastindex else match.group(0)
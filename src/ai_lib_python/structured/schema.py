@@ -6,12 +6,28 @@ Provides schema generation from Python types and Pydantic models.
 
 from __future__ import annotations
 
+import copy
+import functools
 import json
-from typing import TYPE_CHECKING, Any, get_args, get_origin
+import types
+from typing import TYPE_CHECKING, Any, Union, get_args, get_origin
 
 if TYPE_CHECKING:
     from pydantic import BaseModel
 
+# get_origin() of X | Y and of typing.Union[X, Y] / Optional[X]
+_UNION_ORIGINS = (types.UnionType, Union)
+
+# Schemas for leaf types; json_schema_from_type returns copies
+_PRIMITIVE_SCHEMAS: dict[Any, dict[str, Any]] = {
+    str: {"type": "string"},
+    int: {"type": "integer"},
+    float: {"type": "number"},
+    bool: {"type": "boolean"},
+    bytes: {"type": "string", "format": "byte"},
+    type(None): {"type": "null"},
+}
+
 
 def json_schema_from_type(python_type: type) -> dict[str, Any]:
     """Generate JSON schema from a Python type.
@@ -32,21 +48,10 @@ def json_schema_from_type(python_type: type) -> dict[str, Any]:
         >>> print(schema)
         {"type": "array", "items": {"type": "integer"}}
     """
-    # Handle None
-    if python_type is type(None):
-        return {"type": "null"}
-
-    # Handle basic types
-    type_mapping = {
-        str: {"type": "string"},
-        int: {"type": "integer"},
-        float: {"type": "number"},
-        bool: {"type": "boolean"},
-        bytes: {"type": "string", "format": "byte"},
-    }
-
-    if python_type in type_mapping:
-        return type_mapping[python_type]
+    # Handle None and basic types
+    primitive = _PRIMITIVE_SCHEMAS.get(python_type)
+    if primitive is not None:
+        return primitive.copy()
 
     # Handle generic types
     origin = get_origin(python_type)
@@ -79,8 +84,8 @@ def json_schema_from_type(python_type: type) -> dict[str, Any]:
             }
         return {"type": "array"}
 
-    # Handle Union types (including | syntax)
-    if origin is type(int | str):  # Python 3.10+ union
+    # Handle Union types (both | syntax and typing.Union/Optional)
+    if origin in _UNION_ORIGINS:
         schemas = [json_schema_from_type(arg) for arg in args]
         # Check if it's Optional (Union with None)
         none_schemas = [s for s in schemas if s.get("type") == "null"]
@@ -125,6 +130,13 @@ def json_schema_from_pydantic(model: type[BaseModel]) -> dict[str, Any]:
     if not hasattr(model, "model_json_schema"):
         raise ValueError(f"{model} is not a Pydantic model")
 
+    # Callers may edit the schema, so each one gets its own copy
+    return copy.deepcopy(_pydantic_schema(model))
+
+
+@functools.lru_cache(maxsize=256)
+def _pydantic_schema(model: type[BaseModel]) -> dict[str, Any]:
+    """Generate a model's JSON schema once per class."""
     schema = model.model_json_schema()
     if isinstance(schema, dict):
         return schema
@@ -141,6 +153,14 @@ class SchemaGenerator:
         >>> schema = generator.build()
     """
 
+    __slots__ = (
+        "_additional_properties",
+        "_description",
+        "_properties",
+        "_required",
+        "_title",
+    )
+
     def __init__(
         self,
         title: str | None = None,
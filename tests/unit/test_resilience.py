@@ -1,6 +1,9 @@
 """Tests for resilience module."""
 
 import asyncio
+import copy
+import pickle
+import time
 
 import pytest
 
@@ -14,6 +17,8 @@ from ai_lib_python.resilience import (
     CircuitOpenError,
     CircuitState,
     FallbackChain,
+    FallbackConfig,
+    FallbackStrategy,
     JitterStrategy,
     RateLimiter,
     RateLimiterConfig,
@@ -21,8 +26,10 @@ from ai_lib_python.resilience import (
     ResilientExecutor,
     RetryConfig,
     RetryPolicy,
+    TargetTimeoutError,
     with_retry,
 )
+from ai_lib_python.resilience.backpressure import BackpressureError
 
 
 class TestRetryPolicy:
@@ -69,6 +76,21 @@ class TestRetryPolicy:
         # Attempt 2: 4000ms
         assert policy.calculate_delay(2) == 4.0
 
+    def test_config_copied_at_construction(self) -> None:
+        """Test later config changes do not half-apply to a policy."""
+        config = RetryConfig(max_retries=1, min_delay_ms=1000, jitter=JitterStrategy.NONE)
+        policy = RetryPolicy(config)
+        config.max_retries = 5
+        config.min_delay_ms = 10
+        config.retry_on_status.add(418)
+
+        teapot = RemoteError("Teapot", status_code=418, error_class=ErrorClass.INVALID_REQUEST)
+        busy = RemoteError("Busy", status_code=503, error_class=ErrorClass.SERVER_ERROR)
+        assert policy.should_retry(teapot, 0) is False
+        assert policy.should_retry(busy, 0) is True
+        assert policy.should_retry(busy, 1) is False
+        assert policy.calculate_delay(3) == 8.0
+
     def test_calculate_delay_respects_max(self) -> None:
         """Test that delay is capped at max."""
         config = RetryConfig(
@@ -121,6 +143,15 @@ class TestRetryPolicy:
         )
         assert policy.should_retry(auth_error, 0) is False
 
+    def test_should_retry_non_remote_errors(self) -> None:
+        """Test retry decisions for errors that are not RemoteError."""
+        policy = RetryPolicy(RetryConfig())
+
+        assert policy.should_retry(TargetTimeoutError("primary", 100), 0) is True
+        assert policy.should_retry(ValueError("bad input"), 0) is False
+        # Repeated checks for a type reuse the cached decision path
+        assert policy.should_retry(ValueError("again"), 0) is False
+
     @pytest.mark.asyncio
     async def test_execute_success(self) -> None:
         """Test successful execution."""
@@ -202,6 +233,29 @@ class TestRateLimiter:
         config = RateLimiterConfig.from_rpm(60)
         assert config.requests_per_second == 1.0
 
+    @pytest.mark.asyncio
+    async def test_unlimited_specialization(self) -> None:
+        """Test from_config gives unlimited limiters that never throttle."""
+        limiter = RateLimiter.from_config(RateLimiterConfig.unlimited())
+        assert isinstance(limiter, RateLimiter)
+        assert limiter.is_limited is False
+        assert await limiter.try_acquire(1000) is True
+        assert limiter.get_wait_time(1000) == 0.0
+
+        assert type(RateLimiter(RateLimiterConfig.unlimited())) is RateLimiter
+        assert RateLimiter.from_config(RateLimiterConfig.from_rps(1)).is_limited is True
+        adaptive = AdaptiveRateLimiter.from_config(RateLimiterConfig.unlimited())
+        assert type(adaptive) is AdaptiveRateLimiter
+        adaptive = AdaptiveRateLimiter(header_config={"requests_reset": "x-reset"})
+        assert type(adaptive) is AdaptiveRateLimiter
+
+    def test_copy_keeps_limit(self) -> None:
+        """Test copies and pickles of a limited limiter stay limited."""
+        limiter = RateLimiter(RateLimiterConfig.from_rps(1))
+        assert copy.copy(limiter).is_limited is True
+        assert copy.deepcopy(limiter).is_limited is True
+        assert pickle.loads(pickle.dumps(limiter)).is_limited is True
+
     @pytest.mark.asyncio
     async def test_acquire_unlimited(self) -> None:
         """Test acquiring from unlimited limiter."""
@@ -218,6 +272,14 @@ class TestRateLimiter:
         # Should succeed initially
         assert await limiter.try_acquire() is True
 
+    def test_try_acquire_nowait(self) -> None:
+        """Test the synchronous variant takes tokens until the bucket is empty."""
+        limiter = RateLimiter(RateLimiterConfig(requests_per_second=0.1, burst_size=2))
+        assert limiter.try_acquire_nowait() is True
+        assert limiter.try_acquire_nowait() is True
+        assert limiter.try_acquire_nowait() is False
+        assert RateLimiter().try_acquire_nowait(1000) is True
+
     @pytest.mark.asyncio
     async def test_acquire_waits_when_needed(self) -> None:
         """Test that acquire waits when tokens depleted."""
@@ -232,6 +294,49 @@ class TestRateLimiter:
         wait = await limiter.acquire()
         assert wait > 0
 
+    def test_partial_refill_carries_over(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that time short of a whole token counts towards the next one."""
+        clock = [0]
+        monkeypatch.setattr(
+            "ai_lib_python.resilience.rate_limiter.time.monotonic_ns", lambda: clock[0]
+        )
+        config = RateLimiterConfig(requests_per_second=10, burst_size=5, initial_tokens=0)
+        limiter = RateLimiter(config)
+
+        clock[0] = 150_000_000  # 1.5 tokens
+        assert limiter.available_tokens == 1
+        clock[0] = 200_000_000  # 2 tokens
+        assert limiter.available_tokens == 2
+        assert limiter.get_wait_time(3) == pytest.approx(0.1)
+
+    @pytest.mark.asyncio
+    async def test_waiters_served_in_order(self) -> None:
+        """Test that queued acquires are served first come, first served."""
+        config = RateLimiterConfig(requests_per_second=100, burst_size=2, initial_tokens=0)
+        limiter = RateLimiter(config)
+        order = []
+
+        async def take(name: str, tokens: int) -> None:
+            await limiter.acquire(tokens)
+            order.append(name)
+
+        await asyncio.gather(take("big", 2), take("small", 1), take("last", 1))
+        assert order == ["big", "small", "last"]
+
+    @pytest.mark.asyncio
+    async def test_waiter_does_not_hold_lock_while_sleeping(self) -> None:
+        """Test that a sleeping acquire does not block other callers."""
+        config = RateLimiterConfig(requests_per_second=1, burst_size=1, initial_tokens=0)
+        limiter = RateLimiter(config)
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        assert await asyncio.wait_for(limiter.try_acquire(), timeout=0.1) is False
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
 
 class TestAdaptiveRateLimiter:
     """Tests for AdaptiveRateLimiter."""
@@ -250,6 +355,34 @@ class TestAdaptiveRateLimiter:
         assert state["limit"] == 100
         assert state["remaining"] == 50
 
+    def test_header_update_clamps_to_smaller_bucket(self) -> None:
+        """Test tokens never exceed a bucket shrunk by server limits."""
+        limiter = AdaptiveRateLimiter(
+            RateLimiterConfig(requests_per_second=100, burst_size=100),
+            header_config={"requests_reset": "x-ratelimit-reset-requests"},
+        )
+        limiter.update_from_headers(
+            {
+                "x-ratelimit-limit-requests": "10",
+                "x-ratelimit-remaining-requests": "50",
+                "x-ratelimit-reset-requests": "1s",
+            }
+        )
+        assert limiter.available_tokens == 10
+
+    @pytest.mark.asyncio
+    async def test_header_update_wakes_waiters(self) -> None:
+        """Tokens reported by the server are handed to queued waiters."""
+        limiter = AdaptiveRateLimiter(RateLimiterConfig(requests_per_second=0.1, burst_size=1))
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        limiter.update_from_headers({"x-ratelimit-remaining-requests": "5"})
+        await asyncio.wait_for(waiter, timeout=1.0)
+
 
 class TestCircuitBreaker:
     """Tests for CircuitBreaker."""
@@ -337,6 +470,97 @@ class TestCircuitBreaker:
         result = await breaker.execute(success_op)
         assert result == "success"
 
+    @pytest.mark.asyncio
+    async def test_operation_timeout_counts_as_failure(self) -> None:
+        """Test that an operation exceeding timeout_seconds is recorded as a failure."""
+        breaker = CircuitBreaker(CircuitBreakerConfig(timeout_seconds=0.01))
+
+        async def slow_op() -> str:
+            await asyncio.sleep(1)
+            return "late"
+
+        with pytest.raises(asyncio.TimeoutError):
+            await breaker.execute(slow_op)
+
+        assert breaker.get_stats().failed_requests == 1
+
+    @pytest.mark.asyncio
+    async def test_result_cache(self) -> None:
+        """Test that cached results skip the operation until the TTL expires."""
+        breaker = CircuitBreaker(CircuitBreakerConfig(cache_enabled=True, cache_ttl_s=0.05))
+        calls = [0]
+
+        async def op() -> int:
+            calls[0] += 1
+            return calls[0]
+
+        assert await breaker.execute(op, cache_key="k") == 1
+        assert await breaker.execute(op, cache_key="k") == 1
+        assert await breaker.execute(op) == 2
+
+        await asyncio.sleep(0.06)
+        assert await breaker.execute(op, cache_key="k") == 3
+
+        stats = breaker.get_stats()
+        assert stats.cache_hits == 1
+        assert stats.cache_misses == 2
+
+    @pytest.mark.asyncio
+    async def test_result_cache_disabled_by_default(self) -> None:
+        """Test that cache_key is ignored unless caching is configured."""
+        breaker = CircuitBreaker()
+        calls = [0]
+
+        async def op() -> int:
+            calls[0] += 1
+            return calls[0]
+
+        assert await breaker.execute(op, cache_key="k") == 1
+        assert await breaker.execute(op, cache_key="k") == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_fast(self) -> None:
+        """Test the fast path counts successes and still trips on failures."""
+        breaker = CircuitBreaker(CircuitBreakerConfig(failure_threshold=2))
+
+        async def success_op() -> str:
+            return "ok"
+
+        async def fail_op() -> str:
+            raise ValueError("fail")
+
+        for _ in range(3):
+            assert await breaker.execute_fast(success_op) == "ok"
+
+        stats = breaker.get_stats()
+        assert stats.total_requests == 3
+        assert stats.successful_requests == 3
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await breaker.execute_fast(fail_op)
+
+        assert breaker.is_open is True
+        with pytest.raises(CircuitOpenError):
+            await breaker.execute_fast(success_op)
+        assert breaker.get_stats().total_requests == 6
+
+    @pytest.mark.asyncio
+    async def test_execute_fast_success_time(self) -> None:
+        """Test last_success_time is when the success happened, not the read."""
+        breaker = CircuitBreaker()
+
+        async def success_op() -> str:
+            return "ok"
+
+        await breaker.execute_fast(success_op)
+        succeeded_by = time.monotonic()
+        await asyncio.sleep(0.02)
+
+        last_success = breaker.get_stats().last_success_time
+        assert last_success is not None
+        assert last_success <= succeeded_by
+
     def test_reset(self) -> None:
         """Test resetting the circuit."""
         breaker = CircuitBreaker()
@@ -367,6 +591,19 @@ class TestBackpressure:
         bp = Backpressure(config)
         assert bp.is_limited is False
 
+    @pytest.mark.asyncio
+    async def test_unlimited_acquire_tracks_inflight(self) -> None:
+        """Test that unlimited acquire is nestable and still counts in-flight work."""
+        bp = Backpressure(BackpressureConfig.unlimited())
+
+        async with bp.acquire(), bp.acquire():
+            assert bp.current_inflight == 2
+
+        assert bp.current_inflight == 0
+        stats = bp.get_stats()
+        assert stats["peak_inflight"] == 2
+        assert stats["total_acquired"] == 2
+
     @pytest.mark.asyncio
     async def test_acquire_release(self) -> None:
         """Test acquiring and releasing permits."""
@@ -378,6 +615,16 @@ class TestBackpressure:
 
         assert bp.current_inflight == 0
 
+    @pytest.mark.asyncio
+    async def test_snapshot(self) -> None:
+        """Test snapshot reports limit and usage together."""
+        bp = Backpressure(BackpressureConfig(max_concurrent=3))
+
+        async with bp.acquire():
+            assert bp.snapshot() == (3, 1)
+
+        assert bp.snapshot() == (3, 0)
+
     @pytest.mark.asyncio
     async def test_concurrent_limit(self) -> None:
         """Test that concurrent limit is enforced."""
@@ -407,6 +654,86 @@ class TestBackpressure:
         # Wait for completion
         await asyncio.gather(*tasks, return_exceptions=True)
 
+    @pytest.mark.asyncio
+    async def test_try_acquire_does_not_block_when_full(self) -> None:
+        """Test try_acquire returns False immediately when no permit is free."""
+        bp = Backpressure(BackpressureConfig(max_concurrent=1))
+
+        assert await bp.try_acquire() is True
+        assert await asyncio.wait_for(bp.try_acquire(), timeout=0.1) is False
+        assert bp.current_inflight == 1
+
+        bp.release()
+        assert bp.current_inflight == 0
+        assert await bp.try_acquire() is True
+        bp.release()
+
+    def test_try_acquire_nowait(self) -> None:
+        """Test the synchronous variant takes a free permit or returns False."""
+        bp = Backpressure(BackpressureConfig(max_concurrent=1))
+        assert bp.try_acquire_nowait() is True
+        assert bp.try_acquire_nowait() is False
+        bp.release()
+        assert bp.current_inflight == 0
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout_rejects(self) -> None:
+        """Test waiters time out and are removed from the queue."""
+        bp = Backpressure(BackpressureConfig(max_concurrent=1, queue_timeout=0.05))
+
+        async with bp.acquire():
+            with pytest.raises(BackpressureError):
+                async with bp.acquire():
+                    pass
+
+        assert bp.current_inflight == 0
+        assert bp.get_stats()["total_rejected"] == 1
+        async with bp.acquire():
+            assert bp.current_inflight == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_permit(self) -> None:
+        """Test that cancelling a queued acquire leaves the counter consistent."""
+        bp = Backpressure(BackpressureConfig(max_concurrent=1, queue_timeout=5))
+        assert await bp.try_acquire() is True
+
+        async def wait_for_permit() -> None:
+            async with bp.acquire():
+                pass
+
+        task = asyncio.create_task(wait_for_permit())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        bp.release()
+        assert bp.current_inflight == 0
+        assert bp.get_stats()["total_rejected"] == 0
+
+    @pytest.mark.asyncio
+    async def test_acquire_many_waits_for_all_permits(self) -> None:
+        """Test acquire_many grants its permits together."""
+        bp = Backpressure(BackpressureConfig(max_concurrent=3))
+        assert await bp.try_acquire() is True
+        assert await bp.try_acquire() is True
+
+        task = asyncio.create_task(bp.acquire_many(2))
+        await asyncio.sleep(0.01)
+        assert not task.done()
+        assert bp.current_inflight == 2
+
+        bp.release()
+        await asyncio.wait_for(task, timeout=0.1)
+        assert bp.current_inflight == 3
+
+        bp.release_many(2)
+        bp.release()
+        assert bp.current_inflight == 0
+
+        with pytest.raises(ValueError):
+            await bp.acquire_many(4)
+
     def test_get_stats(self) -> None:
         """Test getting backpressure statistics."""
         bp = Backpressure(BackpressureConfig(max_concurrent=5))
@@ -438,6 +765,25 @@ class TestFallbackChain:
         assert result.value == "primary"
         assert result.target_used == "primary"
 
+    @pytest.mark.asyncio
+    async def test_execute_stream_holds_one_permit(self) -> None:
+        """Test a stream of calls shares a single backpressure permit."""
+        chain = FallbackChain()
+        bp = Backpressure(BackpressureConfig(max_concurrent=2))
+        inflight = []
+
+        async def echo(value: int) -> int:
+            inflight.append(bp.current_inflight)
+            return value
+
+        chain.add_target("echo", echo)
+
+        calls = [((i,), {}) for i in range(3)]
+        values = [r.value async for r in chain.execute_stream(calls, backpressure=bp)]
+        assert values == [0, 1, 2]
+        assert inflight == [1, 1, 1]
+        assert bp.current_inflight == 0
+
     @pytest.mark.asyncio
     async def test_fallback_to_secondary(self) -> None:
         """Test falling back to secondary target."""
@@ -462,6 +808,58 @@ class TestFallbackChain:
         assert result.target_used == "secondary"
         assert "primary" in result.errors
 
+    @pytest.mark.asyncio
+    async def test_on_fallback_reports_each_transition(self) -> None:
+        """Test on_fallback fires when each target fails, with the right pair."""
+        chain = FallbackChain()
+
+        async def fail() -> str:
+            raise RemoteError(
+                "Error",
+                status_code=500,
+                error_class=ErrorClass.SERVER_ERROR,
+            )
+
+        async def succeed() -> str:
+            return "third"
+
+        chain.add_target("first", fail)
+        chain.add_target("second", fail)
+        chain.add_target("third", succeed)
+
+        transitions: list[tuple[str, str]] = []
+        result = await chain.execute(
+            on_fallback=lambda src, dst, _err: transitions.append((src, dst))
+        )
+
+        assert result.target_used == "third"
+        assert transitions == [("first", "second"), ("second", "third")]
+
+    @pytest.mark.asyncio
+    async def test_non_fallbackable_error_stops_chain(self) -> None:
+        """Test that errors whose class forbids fallback end the chain."""
+        chain = FallbackChain()
+        calls: list[str] = []
+
+        async def invalid() -> str:
+            calls.append("primary")
+            raise RemoteError(
+                "Bad request",
+                status_code=400,
+                error_class=ErrorClass.INVALID_REQUEST,
+            )
+
+        async def secondary() -> str:
+            calls.append("secondary")
+            return "secondary"
+
+        chain.add_target("primary", invalid)
+        chain.add_target("secondary", secondary)
+
+        result = await chain.execute()
+        assert result.success is False
+        assert calls == ["primary"]
+
     @pytest.mark.asyncio
     async def test_all_targets_fail(self) -> None:
         """Test when all targets fail."""
@@ -481,6 +879,107 @@ class TestFallbackChain:
         assert result.success is False
         assert len(result.errors) == 2
 
+    @pytest.mark.asyncio
+    async def test_hedged_returns_first_success(self) -> None:
+        """Test hedged mode races a slow primary and cancels the loser."""
+        chain = FallbackChain(FallbackConfig(strategy=FallbackStrategy.HEDGED, hedge_delay_ms=10))
+        cancelled = []
+
+        async def slow_primary() -> str:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append("primary")
+                raise
+            return "primary"
+
+        async def fast_secondary() -> str:
+            return "secondary"
+
+        chain.add_target("primary", slow_primary, weight=2.0)
+        chain.add_target("secondary", fast_secondary)
+
+        result = await asyncio.wait_for(chain.execute(), timeout=0.5)
+        assert result.success is True
+        assert result.target_used == "secondary"
+        assert result.targets_tried == ["primary", "secondary"]
+        assert cancelled == ["primary"]
+
+    @pytest.mark.asyncio
+    async def test_hedged_falls_back_on_failure(self) -> None:
+        """Test hedged mode starts the next target as soon as the running one fails."""
+        chain = FallbackChain(
+            FallbackConfig(strategy=FallbackStrategy.HEDGED, hedge_delay_ms=10_000)
+        )
+
+        async def fail() -> str:
+            raise RemoteError(
+                "Error",
+                status_code=503,
+                error_class=ErrorClass.OVERLOADED,
+            )
+
+        async def succeed() -> str:
+            return "secondary"
+
+        chain.add_target("primary", fail, weight=2.0)
+        chain.add_target("secondary", succeed)
+
+        transitions: list[tuple[str, str]] = []
+        result = await asyncio.wait_for(
+            chain.execute(on_fallback=lambda src, dst, _err: transitions.append((src, dst))),
+            timeout=0.5,
+        )
+        assert result.value == "secondary"
+        assert "primary" in result.errors
+        assert transitions == [("primary", "secondary")]
+
+    @pytest.mark.asyncio
+    async def test_per_target_timeout_falls_back(self) -> None:
+        """Test that a hung target times out and the chain moves on."""
+        chain = FallbackChain(FallbackConfig(per_target_timeout_ms=20))
+
+        async def hang() -> str:
+            await asyncio.sleep(1)
+            return "late"
+
+        async def secondary() -> str:
+            return "secondary"
+
+        chain.add_target("primary", hang, weight=2.0)
+        chain.add_target("secondary", secondary)
+
+        result = await asyncio.wait_for(chain.execute(), timeout=0.5)
+        assert result.target_used == "secondary"
+        assert isinstance(result.errors["primary"], TargetTimeoutError)
+
+    @pytest.mark.asyncio
+    async def test_failure_cooldown_demotes_failed_target(self) -> None:
+        """Test that a recently failed target is tried after healthy ones."""
+        chain = FallbackChain(FallbackConfig(failure_cooldown_ms=60_000))
+        calls: list[str] = []
+
+        async def flaky() -> str:
+            calls.append("primary")
+            raise RemoteError(
+                "Error",
+                status_code=500,
+                error_class=ErrorClass.SERVER_ERROR,
+            )
+
+        async def secondary() -> str:
+            calls.append("secondary")
+            return "secondary"
+
+        chain.add_target("primary", flaky, weight=2.0)
+        chain.add_target("secondary", secondary)
+
+        await chain.execute()
+        await chain.execute()
+
+        assert calls == ["primary", "secondary", "secondary"]
+        assert chain.get_targets() == ["primary", "secondary"]
+
     def test_target_management(self) -> None:
         """Test adding and removing targets."""
         chain = FallbackChain()
@@ -496,6 +995,20 @@ class TestFallbackChain:
         chain.remove_target("target1")
         assert chain.get_targets() == ["target2"]
 
+    def test_targets_ordered_by_weight(self) -> None:
+        """Test that priority order follows weight and tracks later additions."""
+        chain = FallbackChain()
+
+        async def op() -> str:
+            return "result"
+
+        chain.add_target("low", op, weight=0.5)
+        chain.add_target("high", op, weight=2.0)
+        assert chain.get_targets() == ["high", "low"]
+
+        chain.add_target("top", op, weight=3.0)
+        assert chain.get_targets() == ["top", "high", "low"]
+
     def test_enable_disable_target(self) -> None:
         """Test enabling and disabling targets."""
         chain = FallbackChain()
@@ -576,6 +1089,81 @@ class TestResilientExecutor:
         assert result == "success"
         assert stats.success is True
 
+    @pytest.mark.asyncio
+    async def test_execute_with_cache_key(self) -> None:
+        """Test that a cache hit skips rate limiting and the operation."""
+        config = ResilientConfig(
+            rate_limit=RateLimiterConfig.from_rps(1),
+            circuit_breaker=CircuitBreakerConfig(cache_enabled=True, cache_ttl_s=60),
+        )
+        executor = ResilientExecutor(config)
+        calls = [0]
+
+        async def op() -> str:
+            calls[0] += 1
+            return "value"
+
+        assert await executor.execute(op, cache_key=("model", "prompt")) == "value"
+        result = await asyncio.wait_for(
+            executor.execute(op, cache_key=("model", "prompt")), timeout=0.1
+        )
+        assert result == "value"
+        assert calls[0] == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_circuit_breaker(self) -> None:
+        """Test that executors given the same breaker trip it together."""
+        breaker_config = CircuitBreakerConfig(failure_threshold=2)
+        config = ResilientConfig(circuit_breaker=breaker_config)
+        breaker = CircuitBreaker(breaker_config)
+        first = ResilientExecutor(config, name="a", circuit_breaker=breaker)
+        second = ResilientExecutor(config, name="b", circuit_breaker=breaker)
+        other = ResilientExecutor(config, name="c")
+
+        async def fail_op() -> str:
+            raise ValueError("fail")
+
+        for executor in (first, second):
+            with pytest.raises(ValueError):
+                await executor.execute(fail_op)
+
+        assert first.circuit_state == "open"
+        assert second.circuit_state == "open"
+        assert other.circuit_state == "closed"
+
+    def test_shared_components_without_config(self) -> None:
+        """Test that passed-in components are used even when not configured."""
+        limiter = RateLimiter(RateLimiterConfig.from_rps(1))
+        backpressure = Backpressure(BackpressureConfig(max_concurrent=3))
+        executor = ResilientExecutor(rate_limiter=limiter, backpressure=backpressure)
+        stats = executor.get_stats()
+        assert stats["rate_limiter"]["is_limited"] is True
+        assert stats["backpressure"]["max_concurrent"] == 3
+
+    @pytest.mark.asyncio
+    async def test_admission_releases_permit(self) -> None:
+        """Test that the backpressure permit is released on success and failure."""
+        config = ResilientConfig(
+            rate_limit=RateLimiterConfig.from_rps(100),
+            backpressure=BackpressureConfig(max_concurrent=1),
+        )
+        executor = ResilientExecutor(config)
+
+        async def success_op() -> str:
+            assert executor.current_inflight == 1
+            return "ok"
+
+        async def fail_op() -> str:
+            raise ValueError("fail")
+
+        assert await executor.execute(success_op) == "ok"
+        with pytest.raises(ValueError):
+            await executor.execute(fail_op)
+        _, stats = await executor.execute_with_stats(success_op)
+
+        assert stats.success is True
+        assert executor.current_inflight == 0
+
     def test_get_stats(self) -> None:
         """Test getting executor statistics."""
         config = ResilientConfig.production()
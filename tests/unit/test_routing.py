@@ -1,10 +1,20 @@
 """Tests for routing module."""
 
+import copy
+import dataclasses
+import json
+import pickle
+import random
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import pytest
 
 from ai_lib_python.routing import (
     CostBasedSelector,
     HealthCheckConfig,
+    LeastConnectionsSelector,
     LoadBalancingStrategy,
     ModelArray,
     ModelCapabilities,
@@ -141,6 +151,18 @@ class TestModelInfo:
         model = ModelInfo(name="gpt-4o")
         assert model.full_id == "gpt-4o"
 
+    def test_full_id_cached_until_reassigned(self) -> None:
+        """Test full_id is reused and follows provider/name changes."""
+        model = ModelInfo(name="gpt-4o", provider="azure")
+        assert model.full_id is model.full_id
+        model.provider = "openai"
+        assert model.full_id == "openai/gpt-4o"
+        model.name = "gpt-4o-mini"
+        assert model.full_id == "openai/gpt-4o-mini"
+        assert ModelInfo.from_dict(model.to_dict()).full_id == "openai/gpt-4o-mini"
+        assert "_full_id" not in dataclasses.asdict(model)
+        assert dataclasses.replace(model, provider="").full_id == "gpt-4o-mini"
+
     def test_supports(self) -> None:
         """Test capability support check."""
         model = ModelInfo(
@@ -151,6 +173,77 @@ class TestModelInfo:
         assert model.supports("multimodal") is True
         assert model.supports("code") is False
 
+    def test_from_dict_round_trip(self) -> None:
+        """Test from_dict restores every field, including defaults."""
+        model = ModelInfo(
+            name="m",
+            provider="p",
+            pricing=PricingInfo(1.0, 2.0),
+            performance=PerformanceMetrics(speed=SpeedTier.FAST),
+            metadata={"k": "v"},
+        )
+        assert ModelInfo.from_dict(model.to_dict()) == model
+
+        minimal = ModelInfo.from_dict({"name": "bare"})
+        assert minimal == ModelInfo(name="bare")
+        assert minimal.display_name == "bare"
+
+        endpoint = ModelEndpoint("e", "m", "http://a.com", weight=2.0, healthy=False)
+        assert ModelEndpoint.from_dict(endpoint.to_dict()) == endpoint
+        assert HealthCheckConfig.from_dict({}) == HealthCheckConfig()
+
+    def test_from_dict_subclass_defaults(self) -> None:
+        """Test from_dict on a dataclass subclass fills its extra fields."""
+
+        @dataclasses.dataclass
+        class Tagged(ModelInfo):
+            tag: str = "none"
+
+        model = Tagged.from_dict({"name": "a"})
+        assert type(model) is Tagged
+        assert model.tag == "none"
+        assert "tag='none'" in repr(model)
+
+    def test_from_dict_interns_identifiers(self) -> None:
+        """Test identifiers loaded from JSON share one string object."""
+        raw = '{"name": "model-from-config", "provider": "provider-from-config"}'
+        first = ModelInfo.from_dict(json.loads(raw))
+        second = ModelInfo.from_dict(json.loads(raw))
+        assert first.name is second.name
+        assert first.provider is second.provider
+
+    def test_from_dict_identifiers_not_str(self) -> None:
+        """Test null or non-str identifiers load without interning."""
+
+        class Name(str):
+            pass
+
+        model = ModelInfo.from_dict({"name": Name("custom"), "provider": None})
+        assert model.provider is None
+        assert model.full_id == "custom"
+        assert type(model.name) is Name
+        endpoint = ModelEndpoint.from_dict({"name": 1, "model_name": Name("m"), "url": "u"})
+        assert endpoint.name == 1
+        assert endpoint.model_name == "m"
+
+    def test_performance_from_dict_tiers(self) -> None:
+        """Test tier values map to members and unknown values still raise."""
+        metrics = PerformanceMetrics.from_dict({"speed": "fast", "quality": "excellent"})
+        assert metrics.speed is SpeedTier.FAST
+        assert metrics.quality is QualityTier.EXCELLENT
+        with pytest.raises(ValueError):
+            PerformanceMetrics.from_dict({"speed": "warp"})
+
+    def test_supports_filter_matches_supports(self) -> None:
+        """Test the filter predicate agrees with supports()."""
+        models = [
+            ModelInfo(name="a", capabilities=ModelCapabilities(function_calling=True)),
+            ModelInfo(name="b", capabilities=ModelCapabilities(tool_use=True, streaming=False)),
+        ]
+        for capability in ("chat", "Tools", "functions", "tool_use", "stream", "unknown"):
+            predicate = ModelInfo.supports_filter(capability)
+            assert [bool(predicate(m)) for m in models] == [m.supports(capability) for m in models]
+
 
 class TestModelSelectors:
     """Tests for model selection strategies."""
@@ -187,6 +280,40 @@ class TestModelSelectors:
         assert names[2] == "slow-quality"
         assert names[3] == "fast-cheap"
 
+    def test_round_robin_selector_threads(self, models: list[ModelInfo]) -> None:
+        """Test concurrent round robin callers split the rotation evenly."""
+        selector = RoundRobinSelector()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            picks = Counter(
+                pool.map(lambda _: selector.select(models).name, range(3000))  # type: ignore[union-attr]
+            )
+        # Each thread rotates on its own, so counts differ by at most one per thread
+        assert sum(picks.values()) == 3000
+        assert max(picks.values()) - min(picks.values()) <= 4
+
+    def test_least_connections_selector(self, models: list[ModelInfo]) -> None:
+        """Test least connections selection follows in-flight counts."""
+        selector = LeastConnectionsSelector()
+        assert selector.select(models).name == "fast-cheap"  # type: ignore[union-attr]
+
+        selector.increment("fast-cheap")
+        selector.increment("balanced")
+        assert selector.select(models).name == "slow-quality"  # type: ignore[union-attr]
+
+        selector.decrement("fast-cheap")
+        selector.decrement("fast-cheap")
+        assert selector.select(models).name == "fast-cheap"  # type: ignore[union-attr]
+
+    def test_select_filtered(self, models: list[ModelInfo]) -> None:
+        """Test selecting only among models matching a predicate."""
+
+        def not_fast(model: ModelInfo) -> bool:
+            return model.performance.speed != SpeedTier.FAST
+
+        assert CostBasedSelector().select_filtered(models, not_fast).name == "balanced"  # type: ignore[union-attr]
+        assert RoundRobinSelector().select_filtered(models, not_fast).name == "balanced"  # type: ignore[union-attr]
+        assert WeightedSelector().select_filtered(models, lambda _: False) is None
+
     def test_cost_based_selector(self, models: list[ModelInfo]) -> None:
         """Test cost-based selection."""
         selector = CostBasedSelector()
@@ -236,6 +363,18 @@ class TestModelSelectors:
 class TestModelManager:
     """Tests for ModelManager."""
 
+    def test_copy_and_pickle(self) -> None:
+        """Test a default (round-robin) manager deep-copies and pickles."""
+        manager = ModelManager("x")
+        manager.add_model(ModelInfo(name="a")).add_model(ModelInfo(name="b"))
+        first = manager.select_model()
+        assert first is not None
+
+        for clone in (copy.deepcopy(manager), pickle.loads(pickle.dumps(manager))):
+            assert [m.name for m in clone.list_models()] == ["a", "b"]
+            names = {clone.select_model().name for _ in range(2)}  # type: ignore[union-attr]
+            assert names == {"a", "b"}
+
     def test_add_and_get_model(self) -> None:
         """Test adding and retrieving models."""
         manager = ModelManager(provider="test")
@@ -277,6 +416,43 @@ class TestModelManager:
         selected = manager.select_model()
         assert selected is not None
 
+    def test_select_model_sees_changes(self) -> None:
+        """Test selection reflects models added or removed after a select."""
+        manager = ModelManager(strategy=ModelSelectionStrategy.COST_BASED)
+        manager.add_model(ModelInfo(name="pricey", pricing=PricingInfo(10.0, 10.0)))
+        assert manager.select_model().name == "pricey"
+
+        manager.add_model(ModelInfo(name="cheap", pricing=PricingInfo(0.1, 0.1)))
+        assert manager.select_model().name == "cheap"
+
+        manager.remove_model("cheap")
+        assert manager.select_model().name == "pricey"
+
+    def test_config_round_trip(self, tmp_path: Path) -> None:
+        """Test saving and reloading models through a config file."""
+        manager = create_openai_models()
+        path = tmp_path / "models.json"
+        manager.save_to_config(path)
+        models = [m.to_dict() for m in manager.list_models()]
+        assert path.read_text() == json.dumps(models, indent=2)
+
+        loaded = ModelManager().load_from_config(path)
+        assert [m.to_dict() for m in loaded.list_models()] == [
+            m.to_dict() for m in manager.list_models()
+        ]
+
+    def test_load_from_config_models_key(self, tmp_path: Path) -> None:
+        """Test loading a {"models": [...]} config fills in the provider."""
+        path = tmp_path / "models.json"
+        path.write_text(
+            json.dumps({"models": [{"name": "m1"}, {"name": "m2", "provider": "other"}]})
+        )
+
+        manager = ModelManager(provider="test").load_from_config(path)
+        assert manager.get_model("m1").provider == "test"  # type: ignore[union-attr]
+        assert manager.get_model("m2").provider == "other"  # type: ignore[union-attr]
+        assert manager.select_model() is not None
+
     def test_recommend_for(self) -> None:
         """Test recommendation by capability."""
         manager = ModelManager()
@@ -297,6 +473,22 @@ class TestModelManager:
         assert recommended is not None
         assert recommended.name == "vision-model"
 
+    def test_recommend_for_sees_in_place_edits(self) -> None:
+        """Test recommendations follow models edited after registration."""
+        manager = ModelManager(strategy=ModelSelectionStrategy.COST_BASED)
+        manager.add_model(
+            ModelInfo(
+                name="pricey",
+                capabilities=ModelCapabilities(code_generation=True),
+                pricing=PricingInfo(10.0, 10.0),
+            )
+        )
+        manager.add_model(ModelInfo(name="cheap", pricing=PricingInfo(0.1, 0.1)))
+        assert manager.recommend_for("code").name == "pricey"  # type: ignore[union-attr]
+
+        manager.get_model("cheap").capabilities.with_code_generation()  # type: ignore[union-attr]
+        assert manager.recommend_for("code").name == "cheap"  # type: ignore[union-attr]
+
     def test_filter_by_capability(self) -> None:
         """Test filtering by capability."""
         manager = ModelManager()
@@ -311,6 +503,10 @@ class TestModelManager:
         assert len(filtered) == 1
         assert filtered[0].name == "m1"
 
+        # Capabilities changed after registration are picked up
+        manager.get_model("m2").capabilities.with_code_generation()  # type: ignore[union-attr]
+        assert len(manager.filter_by_capability("Code")) == 2
+
     def test_filter_by_cost(self) -> None:
         """Test filtering by cost."""
         manager = ModelManager()
@@ -338,6 +534,18 @@ class TestModelManager:
 class TestModelArray:
     """Tests for ModelArray."""
 
+    def test_copy_and_pickle(self) -> None:
+        """Test a default (round-robin) array deep-copies and pickles."""
+        array = ModelArray("a")
+        array.add_endpoint(ModelEndpoint("e1", "m", "http://a.com"))
+        array.add_endpoint(ModelEndpoint("e2", "m", "http://b.com"))
+        assert array.select_endpoint() is not None
+
+        for clone in (copy.deepcopy(array), pickle.loads(pickle.dumps(array))):
+            assert len(clone) == 2
+            names = {clone.select_endpoint().name for _ in range(2)}  # type: ignore[union-attr]
+            assert names == {"e1", "e2"}
+
     def test_add_endpoint(self) -> None:
         """Test adding endpoints."""
         array = ModelArray("cluster")
@@ -347,6 +555,23 @@ class TestModelArray:
         assert len(array) == 2
         assert array.get_endpoint("e1") is not None
 
+    def test_remove_endpoint(self) -> None:
+        """Test removing endpoints by name, including shared names."""
+        array = ModelArray("cluster")
+        first = ModelEndpoint("e1", "m", "http://a.com")
+        second = ModelEndpoint("e1", "m", "http://b.com")
+        array.add_endpoint(first).add_endpoint(second)
+        assert array.endpoints == (first, second)
+        assert array.endpoints is array.endpoints
+
+        assert array.get_endpoint("e1") is first
+        assert array.remove_endpoint("e1") is first
+        assert array.endpoints == (second,)
+        assert array.get_endpoint("e1") is second
+        assert array.remove_endpoint("e1") is second
+        assert array.remove_endpoint("e1") is None
+        assert len(array) == 0
+
     def test_select_endpoint(self) -> None:
         """Test endpoint selection."""
         array = ModelArray("cluster")
@@ -398,12 +623,69 @@ class TestModelArray:
         healthy = array.healthy_endpoints()
         assert len(healthy) == 2
 
+    @pytest.mark.parametrize("strategy", list(LoadBalancingStrategy))
+    def test_direct_health_changes_honored(self, strategy: LoadBalancingStrategy) -> None:
+        """Test setting endpoint.healthy directly affects selection."""
+        array = ModelArray("cluster", strategy=strategy)
+        e1 = ModelEndpoint("e1", "m", "http://a.com")
+        e2 = ModelEndpoint("e2", "m", "http://b.com", healthy=False)
+        array.add_endpoint(e1).add_endpoint(e2)
+
+        e1.healthy = False
+        assert array.select_endpoint() is None
+        assert array.is_healthy() is False
+
+        e2.healthy = True
+        assert all(array.select_endpoint() is e2 for _ in range(10))
+        assert array.healthy_endpoints() == [e2]
+
     def test_with_strategy(self) -> None:
         """Test changing load balancing strategy."""
         array = ModelArray("cluster")
         array.with_strategy(LoadBalancingStrategy.WEIGHTED)
         assert array.strategy == LoadBalancingStrategy.WEIGHTED
 
+    def test_weighted_selection_follows_weights(self) -> None:
+        """Test weighted selection tracks weights and health changes."""
+        random.seed(1234)
+        array = ModelArray("cluster", strategy=LoadBalancingStrategy.WEIGHTED)
+        array.add_endpoint(ModelEndpoint("heavy", "m", "http://a.com", weight=3.0))
+        array.add_endpoint(ModelEndpoint("light", "m", "http://b.com", weight=1.0))
+        array.add_endpoint(ModelEndpoint("zero", "m", "http://c.com", weight=0.0))
+
+        picks = Counter(array.select_endpoint().name for _ in range(4000))  # type: ignore[union-attr]
+        assert picks["zero"] == 0
+        assert 2.5 < picks["heavy"] / picks["light"] < 3.5
+
+        array.mark_unhealthy("heavy")
+        picks = Counter(array.select_endpoint().name for _ in range(100))  # type: ignore[union-attr]
+        assert picks == {"light": 100}
+
+    def test_random_strategy_ignores_weights(self) -> None:
+        """Test the random strategy picks uniformly among endpoints."""
+        random.seed(1234)
+        array = ModelArray("cluster", strategy=LoadBalancingStrategy.RANDOM)
+        array.add_endpoint(ModelEndpoint("e1", "m", "http://a.com", weight=1.0))
+        array.add_endpoint(ModelEndpoint("e2", "m", "http://b.com", weight=0.0))
+
+        picks = Counter(array.select_endpoint().name for _ in range(2000))  # type: ignore[union-attr]
+        assert 0.8 < picks["e1"] / picks["e2"] < 1.25
+
+    def test_selection_tracks_health(self) -> None:
+        """Test selection only returns endpoints currently marked healthy."""
+        array = ModelArray("cluster")
+        array.add_endpoint(ModelEndpoint("e1", "m", "http://a.com"))
+        array.add_endpoint(ModelEndpoint("e2", "m", "http://b.com", healthy=False))
+
+        assert {array.select_endpoint().name for _ in range(4)} == {"e1"}  # type: ignore[union-attr]
+
+        array.mark_healthy("e2")
+        assert {array.select_endpoint().name for _ in range(4)} == {"e1", "e2"}  # type: ignore[union-attr]
+
+        array.remove_endpoint("e1")
+        array.mark_unhealthy("e2")
+        assert array.select_endpoint() is None
+
 
 class TestPreConfiguredManagers:
     """Tests for pre-configured model managers."""
@@ -429,6 +711,13 @@ class TestPreConfiguredManagers:
         assert manager is not None
         assert manager.provider == "openai"
 
+    def test_get_model_manager_is_cached(self) -> None:
+        """Test repeated lookups share one manager per provider."""
+        assert get_model_manager("anthropic") is get_model_manager("anthropic")
+        custom = get_model_manager("custom-provider")
+        assert len(custom) == 0
+        assert get_model_manager("custom-provider") is custom
+
 
 class TestHealthCheckConfig:
     """Tests for HealthCheckConfig."""
@@ -1,14 +1,23 @@
 """Tests for signals and preflight modules."""
 
+import dataclasses
+
 import pytest
 
 from ai_lib_python.resilience import (
+    AdaptiveRateLimiter,
+    Backpressure,
+    BackpressureConfig,
+    CircuitBreaker,
+    CircuitBreakerConfig,
     CircuitBreakerSnapshot,
     InflightSnapshot,
     PreflightChecker,
     PreflightConfig,
     PreflightError,
     PreflightResult,
+    RateLimiter,
+    RateLimiterConfig,
     RateLimiterSnapshot,
     SignalsSnapshot,
 )
@@ -35,6 +44,18 @@ class TestInflightSnapshot:
         assert d["in_use"] == 5
         assert d["utilization"] == 0.5
 
+    def test_to_dict_returns_fresh_dict(self) -> None:
+        """Test each to_dict call returns its own dict."""
+        snapshot = InflightSnapshot(max_concurrent=10, available=5, in_use=5)
+        first = snapshot.to_dict()
+        first["in_use"] = 0
+        assert snapshot.to_dict()["in_use"] == 5
+        assert [f.name for f in dataclasses.fields(snapshot)] == [
+            "max_concurrent",
+            "available",
+            "in_use",
+        ]
+
 
 class TestRateLimiterSnapshot:
     """Tests for RateLimiterSnapshot."""
@@ -143,6 +164,15 @@ class TestSignalsSnapshot:
         )
         assert snapshot.health_score == 0.5
 
+    def test_score_batch(self) -> None:
+        """Test scoring several snapshots in one call."""
+        degraded = SignalsSnapshot(
+            circuit_breaker=CircuitBreakerSnapshot(
+                state="half_open", failure_count=5, failure_threshold=5
+            ),
+        )
+        assert SignalsSnapshot.score_batch([SignalsSnapshot(), degraded]) == [1.0, 0.5]
+
     def test_empty_snapshot(self) -> None:
         """Test empty snapshot."""
         snapshot = SignalsSnapshot()
@@ -189,6 +219,36 @@ class TestPreflightResult:
         assert result.passed is False
         assert len(result.errors) == 1
 
+    def test_is_dataclass(self) -> None:
+        """Test dataclass helpers work on results."""
+        result = PreflightResult(passed=False)
+        assert [f.name for f in dataclasses.fields(result)] == [
+            "passed",
+            "permit",
+            "signals",
+            "errors",
+        ]
+        assert dataclasses.asdict(result)["passed"] is False
+        assert dataclasses.replace(result, passed=True).passed is True
+
+    def test_release_permit_only_once(self) -> None:
+        """Test a permit is released once and over-release is tolerated."""
+
+        class Permit:
+            def __init__(self) -> None:
+                self.released = 0
+
+            def release(self) -> None:
+                self.released += 1
+                raise ValueError("released too many times")
+
+        permit = Permit()
+        result = PreflightResult(permit=permit)
+        result.release_permit()
+        result.release_permit()
+        assert permit.released == 1
+        assert result.permit is None
+
 
 class TestPreflightChecker:
     """Tests for PreflightChecker."""
@@ -199,6 +259,77 @@ class TestPreflightChecker:
         checker = PreflightChecker()
         result = await checker.check()
         assert result.passed is True
+        assert result.signals is not None
+
+    @pytest.mark.asyncio
+    async def test_check_without_signals(self) -> None:
+        """Test signals can be skipped by callers that do not read them."""
+        checker = PreflightChecker()
+        result = await checker.check(with_signals=False)
+        assert result.passed is True
+        assert result.signals is None
+
+    @pytest.mark.asyncio
+    async def test_check_with_rate_limiter_passes(self) -> None:
+        """Test that getting a token immediately passes the check."""
+        limiter = RateLimiter(RateLimiterConfig.from_rps(10))
+        checker = PreflightChecker(rate_limiter=limiter)
+
+        result = await checker.check()
+        assert result.passed is True
+        assert limiter.available_tokens < 15
+
+    @pytest.mark.asyncio
+    async def test_saturated_backpressure_skips_rate_limiter(self) -> None:
+        """Test that a rejected request does not consume a rate-limit token."""
+        limiter = RateLimiter(RateLimiterConfig.from_rps(10))
+        backpressure = Backpressure(BackpressureConfig(max_concurrent=1))
+        assert await backpressure.try_acquire() is True
+        checker = PreflightChecker(rate_limiter=limiter, backpressure=backpressure)
+
+        result = await checker.check()
+        assert result.passed is False
+        assert [e.component for e in result.errors] == ["backpressure"]
+        assert limiter.available_tokens == 15
+
+    @pytest.mark.asyncio
+    async def test_repeated_rejections_return_distinct_errors(self) -> None:
+        """Test that repeated rejections return independent, fully built errors."""
+        backpressure = Backpressure(BackpressureConfig(max_concurrent=1))
+        assert await backpressure.try_acquire() is True
+        checker = PreflightChecker(backpressure=backpressure)
+
+        first = (await checker.check()).errors[0]
+        second = (await checker.check()).errors[0]
+        assert first is not second
+        assert str(first) == "Backpressure limit reached"
+        assert first.retry_after_ms == 100
+        assert first.args == ("Backpressure limit reached",)
+        first.with_hint("slow down")
+        assert second.context.hint is None
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_reports_cooldown(self) -> None:
+        """Test that an open circuit fails preflight with the remaining cooldown."""
+        breaker = CircuitBreaker(CircuitBreakerConfig(failure_threshold=1, cooldown_seconds=30))
+
+        async def fail() -> None:
+            raise ValueError("fail")
+
+        with pytest.raises(ValueError):
+            await breaker.execute(fail)
+
+        checker = PreflightChecker(circuit_breaker=breaker)
+        result = await checker.check()
+        assert result.passed is False
+        assert result.errors[0].component == "circuit_breaker"
+        assert 29_000 < (result.errors[0].retry_after_ms or 0) <= 30_000
+
+        snapshot = checker.get_signals().circuit_breaker
+        assert snapshot is not None
+        assert snapshot.is_open
+        assert snapshot.failure_count == 1
+        assert 29_000 < (snapshot.cooldown_remaining_ms or 0) <= 30_000
 
     @pytest.mark.asyncio
     async def test_get_signals(self) -> None:
@@ -208,6 +339,27 @@ class TestPreflightChecker:
         assert signals.provider == "openai"
         assert signals.model == "gpt-4o"
 
+    @pytest.mark.asyncio
+    async def test_get_signals_reflects_admission(self) -> None:
+        """Test signals read right after a check see the token it took."""
+        limiter = RateLimiter(RateLimiterConfig(requests_per_second=0.1, burst_size=2))
+        checker = PreflightChecker(rate_limiter=limiter)
+        before = checker.get_signals()
+        await checker.check()
+        after = checker.get_signals()
+        assert after is not before
+        assert after.rate_limiter is not None and before.rate_limiter is not None
+        assert after.rate_limiter.tokens_available == before.rate_limiter.tokens_available - 1
+
+    @pytest.mark.asyncio
+    async def test_update_rate_limits_skips_non_ascii_digits(self) -> None:
+        """Test headers like "²" pass isdigit() but are skipped, not raised."""
+        checker = PreflightChecker(rate_limiter=AdaptiveRateLimiter())
+        await checker.update_rate_limits(
+            {"x-ratelimit-remaining-requests": "²", "x-ratelimit-reset-requests": "²"}
+        )
+        await checker.update_rate_limits({"X-RateLimit-Remaining-Requests": "5"})
+
     def test_on_success(self) -> None:
         """Test success reporting."""
         # Should not raise
@@ -1,9 +1,12 @@
 """Tests for structured output module."""
 
+import dataclasses
 import json
+from datetime import datetime
+from typing import Any, Optional, Union
 
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from ai_lib_python.structured import (
     JsonMode,
@@ -12,6 +15,8 @@ from ai_lib_python.structured import (
     SchemaGenerator,
     StructuredOutput,
     ValidationResult,
+    json_mode,
+    json_schema_from_pydantic,
     json_schema_from_type,
 )
 from ai_lib_python.structured.json_mode import extract_json
@@ -27,6 +32,11 @@ class TestJsonSchemaFromType:
         assert json_schema_from_type(float) == {"type": "number"}
         assert json_schema_from_type(bool) == {"type": "boolean"}
 
+    def test_basic_types_are_fresh_dicts(self) -> None:
+        """Test editing a returned schema leaves later results untouched."""
+        SchemaGenerator().add_property("name", str, description="Name")
+        assert json_schema_from_type(str) == {"type": "string"}
+
     def test_list_type(self) -> None:
         """Test list type conversion."""
         schema = json_schema_from_type(list[int])
@@ -39,11 +49,34 @@ class TestJsonSchemaFromType:
         assert schema["type"] == "object"
         assert schema["additionalProperties"]["type"] == "integer"
 
+    def test_union_types(self) -> None:
+        """Test both union spellings, with and without None."""
+        for optional in (int | None, Optional[int]):  # noqa: UP045
+            assert json_schema_from_type(optional) == {"type": "integer", "nullable": True}  # type: ignore[arg-type]
+        for union in (int | str, Union[int, str]):  # noqa: UP007
+            assert json_schema_from_type(union) == {  # type: ignore[arg-type]
+                "anyOf": [{"type": "integer"}, {"type": "string"}]
+            }
+
     def test_none_type(self) -> None:
         """Test None type."""
         assert json_schema_from_type(type(None)) == {"type": "null"}
 
 
+class TestJsonSchemaFromPydantic:
+    """Tests for json_schema_from_pydantic."""
+
+    def test_cached_schema_is_copied(self) -> None:
+        """Test callers editing a schema do not affect later calls."""
+
+        class Item(BaseModel):
+            name: str
+
+        first = json_schema_from_pydantic(Item)
+        first["properties"]["name"]["description"] = "edited"
+        assert json_schema_from_pydantic(Item) == Item.model_json_schema()
+
+
 class TestSchemaGenerator:
     """Tests for SchemaGenerator."""
 
@@ -100,6 +133,35 @@ class TestSchemaGenerator:
         json_str = gen.to_json()
         parsed = json.loads(json_str)
         assert "properties" in parsed
+        assert json_str == json.dumps(gen.build(), indent=2)
+        assert gen.to_json(indent=4) == json.dumps(gen.build(), indent=4)
+
+    def test_to_json_large_integer_default(self) -> None:
+        """Test defaults beyond 64 bits still serialize."""
+        gen = SchemaGenerator()
+        gen.add_property("id", int, default=2**70)
+        assert json.loads(gen.to_json())["properties"]["id"]["default"] == 2**70
+
+    def test_to_json_escapes_non_ascii(self) -> None:
+        """Test non-ASCII text is escaped as json.dumps does."""
+        gen = SchemaGenerator(description="Café menu")
+        assert "Caf\\u00e9 menu" in gen.to_json()
+
+    def test_build_returns_fresh_schema(self) -> None:
+        """Test edits to a built schema do not leak into later builds."""
+        gen = SchemaGenerator(title="Thing")
+        gen.add_property("a", str)
+        schema = gen.build()
+        schema["title"] = "Other"
+        schema.pop("additionalProperties")
+
+        rebuilt = gen.build()
+        assert rebuilt["title"] == "Thing"
+        assert rebuilt["additionalProperties"] is False
+        assert json.loads(gen.to_json())["title"] == "Thing"
+
+        gen.add_property("b", int)
+        assert "b" in json.loads(gen.to_json())["properties"]
 
 
 class TestOutputValidator:
@@ -235,6 +297,21 @@ class TestJsonModeConfig:
         config = JsonModeConfig(mode=JsonMode.OFF)
         assert config.to_openai_format() == {}
 
+    def test_openai_format_fresh_per_call(self) -> None:
+        """Test each call returns its own dict and follows config changes."""
+        config = JsonModeConfig.from_schema({"type": "object"}, name="test")
+        first = config.to_openai_format()
+        first["response_format"]["json_schema"]["strict"] = False
+        assert config.to_openai_format()["response_format"]["json_schema"]["strict"] is True
+        config.strict = False
+        assert config.to_openai_format()["response_format"]["json_schema"]["strict"] is False
+        assert [f.name for f in dataclasses.fields(config)] == [
+            "mode",
+            "schema",
+            "schema_name",
+            "strict",
+        ]
+
 
 class TestStructuredOutput:
     """Tests for StructuredOutput."""
@@ -262,6 +339,40 @@ class TestStructuredOutput:
         assert output.is_valid
         assert isinstance(output.validated, User)
 
+    def test_from_response_matches_validate(self) -> None:
+        """Test from_response validates the parsed dict like validate() does."""
+
+        class Event(BaseModel):
+            model_config = ConfigDict(strict=True)
+
+            at: datetime
+
+        validator = OutputValidator(Event)
+        content = '{"at": "2024-01-01T00:00:00"}'
+        output = StructuredOutput.from_response(content, validator)
+        assert output.parsed == {"at": "2024-01-01T00:00:00"}
+        assert output.is_valid == validator.validate(content).valid
+        assert not output.is_valid
+
+    def test_from_response_equality_independent_of_reads(self) -> None:
+        """Test reading .parsed does not change equality or the field set."""
+
+        class User(BaseModel):
+            name: str
+
+        validator = OutputValidator(User)
+        first = StructuredOutput.from_response('{"name": "Alice"}', validator)
+        second = StructuredOutput.from_response('{"name": "Alice"}', validator)
+        assert first.parsed == {"name": "Alice"}
+        assert first == second
+        assert [f.name for f in dataclasses.fields(first)] == [
+            "raw",
+            "parsed",
+            "validated",
+            "validation_result",
+        ]
+        assert dataclasses.replace(first, parsed=None).parsed is None
+
     def test_as_model(self) -> None:
         """Test getting output as model."""
 
@@ -315,3 +426,35 @@ class TestExtractJson:
         """Test when no JSON is found."""
         result = extract_json("Just some text")
         assert result is None
+
+    def test_large_integers_and_nan_kept_exact(self) -> None:
+        """Test integers beyond 64 bits and NaN parse as json.loads does."""
+        big = 123456789012345678901234567890
+        assert extract_json(f'{{"id": {big}}}') == {"id": big}
+        assert extract_json(f'{{"id": {-(2**63) - 1}}}') == {"id": -(2**63) - 1}
+        assert StructuredOutput.from_response(f'{{"id": {big}}}').parsed == {"id": big}
+        result = extract_json('{"score": NaN}')
+        assert result is not None
+        assert result["score"] != result["score"]
+
+    def test_embedded_json_parsed_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a first extraction parses the located JSON only once."""
+        calls: list[str] = []
+        loads = json.loads
+
+        def counting_loads(text: str) -> Any:
+            calls.append(text)
+            return loads(text)
+
+        monkeypatch.setattr(json_mode.json, "loads", counting_loads)
+        text = 'Only once:\n```json\n{"n": 1}\n```'
+        assert extract_json(text) == {"n": 1}
+        assert calls == [text, '{"n": 1}']
+
+    def test_repeated_extraction_returns_fresh_dicts(self) -> None:
+        """Test repeated extraction never hands out a shared dict."""
+        text = 'Result:\n```json\n{"items": [1, 2]}\n```'
+        first = extract_json(text)
+        assert first is not None
+        first["items"].append(3)
+        assert extract_json(text) == {"items": [1, 2]}